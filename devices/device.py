@@ -5,7 +5,11 @@ IoT Device - Simulates a device receiving data from middleware
 
 import asyncio
 import json
+import logging
 import sys
+import traceback
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from typing import Dict, Any, Optional
 import structlog
@@ -24,7 +28,6 @@ class IoTDevice:
         self.logger = structlog.get_logger(f"device_{device_id}")
         
         # Create timestamped log file path at initialization
-        from datetime import datetime
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.log_file = Path("logs") / f"device_{device_id}_{timestamp}.log"
     
@@ -103,7 +106,6 @@ class IoTDevice:
             self.data_count += 1
             
             # Log received data in the requested format
-            from datetime import datetime
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             log_message = f"{timestamp} | INFO | Data received | device_id={self.device_id} | object={object_name} | value={value}"
             
@@ -159,11 +161,7 @@ async def main():
     print(f"  - MQTT Host: {config['mqtt']['host']}:{config['mqtt']['port']}")
     print(f"  - Topic: {config['mqtt']['topic']}")
     
-    # Setup logging
-    import logging
-    from logging.handlers import RotatingFileHandler
-    
-    # Create logs directory
+    # Setup logging: create logs directory
     logs_dir = Path("logs")
     logs_dir.mkdir(parents=True, exist_ok=True)
     
@@ -204,7 +202,6 @@ async def main():
     # Configure structlog with custom formatter
     def simple_formatter(logger, method_name, event_dict):
         """Simple formatter for clean logs"""
-        level = event_dict.get('level', 'INFO').upper()
         message = event_dict.get('event', '')
         
         # Extract key fields
@@ -221,11 +218,9 @@ async def main():
     
     structlog.configure(
         processors=[
+            # The stdlib handlers add time and level; simple_formatter only
+            # reads the event and device fields, so nothing else is computed
             structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_log_level,
-            structlog.processors.TimeStamper(fmt="%H:%M:%S"),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
             simple_formatter
         ],
         context_class=dict,
@@ -245,7 +240,6 @@ async def main():
         print(f"\nShutting down {device_id} Device...")
     except Exception as e:
         print(f"Error starting device: {e}")
-        import traceback
         traceback.print_exc()
     finally:
         await device.stop()
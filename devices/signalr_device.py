@@ -5,7 +5,11 @@ IoT Device (SignalR) - Simulates a device receiving data from middleware via Sig
 
 import asyncio
 import json
+import logging
 import sys
+import traceback
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from typing import Dict, Any, Optional
 import structlog
@@ -31,7 +35,6 @@ class IoTDevice:
         self.logger = structlog.get_logger(f"device_{device_id}")
         
         # Create timestamped log file path at initialization
-        from datetime import datetime
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.log_file = Path("logs") / f"device_{device_id}_{timestamp}.log"
     
@@ -140,7 +143,6 @@ class IoTDevice:
             self.data_count += 1
             
             # Log received data in the requested format
-            from datetime import datetime
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             log_message = f"{timestamp} | INFO | Data received | device_id={self.device_id} | object={object_name} | value={value}"
             
@@ -220,8 +222,6 @@ async def main():
     print(f"  - Group: {config['signalr']['group']}")
     
     # Setup logging
-    import logging
-    from logging.handlers import RotatingFileHandler
     logs_dir = Path("logs")
     logs_dir.mkdir(parents=True, exist_ok=True)
     log_file = logs_dir / config.get('logging', {}).get('file', 'device.log')
@@ -238,7 +238,6 @@ async def main():
     # Configure structlog with custom formatter
     def simple_formatter(logger, method_name, event_dict):
         """Simple formatter for clean logs"""
-        level = event_dict.get('level', 'INFO').upper()
         message = event_dict.get('event', '')
         
         # Extract key fields
@@ -255,11 +254,9 @@ async def main():
     
     structlog.configure(
         processors=[
+            # The stdlib handlers add time and level; simple_formatter only
+            # reads the event and device fields, so nothing else is computed
             structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_log_level,
-            structlog.processors.TimeStamper(fmt="%H:%M:%S"),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
             simple_formatter
         ],
         context_class=dict,
@@ -279,7 +276,6 @@ async def main():
         print(f"\nShutting down {device_id} Device...")
     except Exception as e:
         print(f"Error starting device: {e}")
-        import traceback
         traceback.print_exc()
     finally:
         await device.stop()
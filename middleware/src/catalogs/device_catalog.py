@@ -2,12 +2,13 @@
 Device Catalog - Maps objects to devices
 """
 
-import yaml
+import asyncio
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 import structlog
 
 from models.events import MappedEvent, ResolvedEvent
+from utils.yaml_cache import load_yaml_cached
 
 
 class DeviceCatalog:
@@ -18,13 +19,18 @@ class DeviceCatalog:
         self.object_to_devices: Dict[str, List[str]] = {}
         self.logger = structlog.get_logger("device_catalog")
     
+    def _read_yaml(self):
+        """Read and parse the catalog YAML file"""
+        # JSON sidecar cache is reused while the catalog file is unchanged
+        return load_yaml_cached(self.config_path)
+    
     async def load(self):
         """Load device catalog from YAML file"""
         if not self.config_path.exists():
             raise FileNotFoundError(f"Device catalog not found: {self.config_path}")
         
-        with open(self.config_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        # Parse in a worker thread so catalogs can load side by side
+        data = await asyncio.to_thread(self._read_yaml)
         
         self.object_to_devices.clear()
         
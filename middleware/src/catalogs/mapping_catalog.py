@@ -2,12 +2,13 @@
 Mapping Catalog - Maps (equip_tag, message_id) to object and value_type
 """
 
-import yaml
+import asyncio
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 import structlog
 
 from models.events import IngressEvent, MappedEvent
+from utils.yaml_cache import load_yaml_cached
 
 
 class MappingRule:
@@ -31,13 +32,18 @@ class MappingCatalog:
         self.mappings: Dict[Tuple[str, str], MappingRule] = {}
         self.logger = structlog.get_logger("mapping_catalog")
     
+    def _read_yaml(self):
+        """Read and parse the catalog YAML file"""
+        # JSON sidecar cache is reused while the catalog file is unchanged
+        return load_yaml_cached(self.config_path)
+    
     async def load(self):
         """Load mapping rules from YAML file"""
         if not self.config_path.exists():
             raise FileNotFoundError(f"Mapping catalog not found: {self.config_path}")
         
-        with open(self.config_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        # Parse in a worker thread so catalogs can load side by side
+        data = await asyncio.to_thread(self._read_yaml)
         
         self.mappings.clear()
         
@@ -4,7 +4,7 @@ Base layer interface and abstract classes
 
 from abc import ABC, abstractmethod
 from typing import Any, Optional
-import asyncio
+import time
 import structlog
 
 from models.events import LayerResult, LayerStatus
@@ -44,12 +44,12 @@ class BaseLayer(ABC):
     def _increment_processed(self) -> None:
         """Increment processed count"""
         self.processed_count += 1
-        self.last_activity = asyncio.get_event_loop().time()
+        self.last_activity = time.monotonic()
     
     def _increment_error(self) -> None:
         """Increment error count"""
         self.error_count += 1
-        self.last_activity = asyncio.get_event_loop().time()
+        self.last_activity = time.monotonic()
 
 
 class InputLayerInterface(BaseLayer):
@@ -11,23 +11,27 @@ import structlog
 from aiomqtt import Client as MQTTClient
 
 from layers.base import InputLayerInterface
-from models.events import IngressEvent
+from models.events import IngressEvent, RawPayload
 from models.config import InputConfig
 
 
 class MQTTInputHandler:
     """MQTT input handler"""
     
-    def __init__(self, config, callback: Callable[[IngressEvent], None]):
+    def __init__(self, config, callback: Callable[[IngressEvent], None], client: Optional[MQTTClient] = None):
         self.config = config
         self.callback = callback
         self.logger = structlog.get_logger("mqtt_input")
-        self.client = None
+        self.client = client
+        self._owns_client = client is None  # A shared client is connected by its owner
         self.is_running = False
     
     async def start(self):
         """Start MQTT client"""
         try:
+            if not self._owns_client:
+                await self._consume()
+                return
             
             self.client = MQTTClient(
                 hostname=self.config.host,
@@ -38,22 +42,26 @@ class MQTTInputHandler:
             )
             
             async with self.client:
-                self.is_running = True
-                # Subscribe to topic
-                await self.client.subscribe(self.config.topic, qos=self.config.qos)
-                
-                async for message in self.client.messages:
-                    if not self.is_running:
-                        break
-                    
-                    try:
-                        await self._process_message(message)
-                    except Exception as e:
-                        pass
+                await self._consume()
                         
         except Exception as e:
             raise
     
+    async def _consume(self):
+        """Subscribe and process messages on the connected client"""
+        self.is_running = True
+        # Subscribe to topic
+        await self.client.subscribe(self.config.topic, qos=self.config.qos)
+        
+        async for message in self.client.messages:
+            if not self.is_running:
+                break
+            
+            try:
+                await self._process_message(message)
+            except Exception as e:
+                pass
+    
     async def stop(self):
         """Stop MQTT client"""
         self.is_running = False
@@ -73,6 +81,7 @@ class MQTTInputHandler:
             ingress_event = IngressEvent(
                 trace_id=trace_id,
                 raw=payload,
+                payload=RawPayload.from_raw(payload),
                 meta={
                     "source": "mqtt",
                     "topic": message.topic,
@@ -91,10 +100,11 @@ class MQTTInputHandler:
 class InputLayer(InputLayerInterface):
     """Input Layer - MQTT Only"""
     
-    def __init__(self, config: InputConfig, mapping_layer_callback: Callable[[IngressEvent], None]):
+    def __init__(self, config: InputConfig, mapping_layer_callback: Callable[[IngressEvent], None], mqtt_client: Optional[MQTTClient] = None):
         super().__init__("input_layer")
         self.config = config
         self.mapping_layer_callback = mapping_layer_callback
+        self.mqtt_client = mqtt_client
         self.handler = None
         self._task = None
     
@@ -107,7 +117,8 @@ class InputLayer(InputLayerInterface):
             
             self.handler = MQTTInputHandler(
                 self.config.mqtt,
-                self._on_ingress_event
+                self._on_ingress_event,
+                client=self.mqtt_client
             )
             
             # Start handler in background task
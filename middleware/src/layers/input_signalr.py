@@ -4,6 +4,7 @@ Input Layer - SignalR External data reception (Optimized)
 
 import asyncio
 import json
+import threading
 import uuid
 from typing import Optional, Callable, Any, Dict, List
 import structlog
@@ -14,17 +15,30 @@ try:
     from signalrcore.hub_connection_builder import HubConnectionBuilder
     from signalrcore.hub.base_hub_connection import BaseHubConnection
     SIGNALR_AVAILABLE = True
+    SIGNALR_IMPORT_ERROR = None
 except ImportError as e:
-    print(f"SignalR import error: {e}")
+    # Reported when a SignalR handler is constructed, not at import time
     SIGNALR_AVAILABLE = False
+    SIGNALR_IMPORT_ERROR = e
     HubConnectionBuilder = None
     BaseHubConnection = None
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 from layers.base import InputLayerInterface
-from models.events import IngressEvent
+from models.events import IngressEvent, RawPayload
 from models.config import InputConfig
 
 
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
 class SignalRConnectionPool:
     """SignalR connection pool for better performance"""
     
@@ -34,6 +48,8 @@ class SignalRConnectionPool:
         self.connections: deque = deque()
         self.active_connections = 0
         self.logger = structlog.get_logger("signalr_pool")
+        self.open_timeout = 5.0
+        self._connection_returned = asyncio.Event()  # Wakes get_connection waiters
         
     async def get_connection(self) -> BaseHubConnection:
         """Get a connection from pool or create new one"""
@@ -45,33 +61,60 @@ class SignalRConnectionPool:
             self.active_connections += 1
             return connection
         
-        # Wait for available connection
+        # Park until a connection is returned instead of polling
         while not self.connections:
-            await asyncio.sleep(0.01)
+            self._connection_returned.clear()
+            await self._connection_returned.wait()
         return self.connections.popleft()
     
     async def return_connection(self, connection: BaseHubConnection):
         """Return connection to pool"""
         if connection and self._is_connection_healthy(connection):
             self.connections.append(connection)
+            self._connection_returned.set()
         else:
             self.active_connections -= 1
     
     async def _create_connection(self) -> BaseHubConnection:
         """Create new SignalR connection"""
+        loop = asyncio.get_running_loop()
+        loop_thread = threading.get_ident()
+        opened = asyncio.Event()
+        
+        # Let signalrcore reconnect in place instead of rebuilding the connection
         connection = HubConnectionBuilder() \
             .with_url(self.config.url) \
+            .with_automatic_reconnect({
+                "type": "raw",
+                "keep_alive_interval": self.config.keepalive_interval,
+                "reconnect_interval": self.config.retry_delay,
+                "max_attempts": self.config.max_retry_attempts
+            }) \
             .build()
         
+        def on_open():
+            self.logger.debug("SignalR connection opened")
+            if threading.get_ident() == loop_thread:
+                opened.set()
+            else:
+                # Callback normally runs on the signalrcore thread
+                loop.call_soon_threadsafe(opened.set)
+        
         # Optimized connection setup
-        connection.on_open(lambda: self.logger.debug("SignalR connection opened"))
+        connection.on_open(on_open)
         connection.on_close(lambda: self.logger.debug("SignalR connection closed"))
         connection.on_error(lambda data: self.logger.error("SignalR connection error", error=data))
+        # Group membership is per connection id, rejoin after the library reconnects
+        connection.on_reconnect(lambda: connection.send("JoinGroup", [self.config.group]))
         
         connection.start()
         
-        # Non-blocking wait for connection
-        await asyncio.sleep(0.5)
+        # Join only once the hub handshake completes instead of after a fixed delay
+        try:
+            await asyncio.wait_for(opened.wait(), timeout=self.open_timeout)
+        except asyncio.TimeoutError:
+            self.logger.warning("SignalR connection did not open in time",
+                              timeout=self.open_timeout)
         
         # Join group
         connection.send("JoinGroup", [self.config.group])
@@ -106,30 +149,37 @@ class SignalRInputHandler:
         self.config = config
         self.callback = callback
         self.logger = structlog.get_logger("signalr_input")
+        if not SIGNALR_AVAILABLE:
+            self.logger.error("SignalR is not available. Please install signalrcore library.",
+                            error=str(SIGNALR_IMPORT_ERROR))
+            raise ImportError("SignalR library not available")
         self.connection_pool = SignalRConnectionPool(config, max_connections=3)
         self.is_running = False
         self.message_queue = deque(maxlen=1000)  # Message queue for batch processing
         self.batch_size = 10
         self.batch_timeout = 0.1  # 100ms batch timeout
         self._batch_task = None
+        self._loop = None
+        self._message_event = None
         
     async def start(self):
         """Start SignalR connection with optimized setup"""
-        if not SIGNALR_AVAILABLE:
-            self.logger.error("SignalR is not available. Please install signalrcore library.")
-            raise ImportError("SignalR library not available")
-            
         try:
             # Get connection from pool
             self.connection = await self.connection_pool.get_connection()
             
+            # Wake the batch task on arrival instead of polling while idle
+            self._loop = asyncio.get_running_loop()
+            self._message_event = asyncio.Event()
+            
             # Register optimized message handler
             self.connection.on("ingress", self._on_message)
             
+            # Mark running first so an eagerly started task doesn't exit immediately
+            self.is_running = True
+            
             # Start batch processing task
             self._batch_task = asyncio.create_task(self._process_batch_messages())
-            
-            self.is_running = True
             # Silent startup
             
         except Exception as e:
@@ -168,13 +218,13 @@ class SignalRInputHandler:
             # Parse message efficiently
             if isinstance(message, str):
                 try:
-                    payload = json.loads(message)
+                    payload = _loads(message)
                 except json.JSONDecodeError:
                     return
             elif isinstance(message, list) and len(message) > 0:
                 if isinstance(message[0], str):
                     try:
-                        payload = json.loads(message[0])
+                        payload = _loads(message[0])
                     except json.JSONDecodeError:
                         return
                 else:
@@ -185,6 +235,10 @@ class SignalRInputHandler:
             # Add to message queue for batch processing
             self.message_queue.append(payload)
             
+            # Only signal the loop when the batch task may be waiting
+            if not self._message_event.is_set():
+                self._loop.call_soon_threadsafe(self._message_event.set)
+            
         except Exception as e:
             self.logger.error("Error processing SignalR message", error=str(e))
     
@@ -192,8 +246,10 @@ class SignalRInputHandler:
         """Process messages in batches for better performance"""
         while self.is_running:
             try:
+                # Clear before checking so a message arriving in between still wakes us
+                self._message_event.clear()
                 if not self.message_queue:
-                    await asyncio.sleep(self.batch_timeout)
+                    await self._message_event.wait()
                     continue
                 
                 # Collect batch of messages
@@ -223,6 +279,7 @@ class SignalRInputHandler:
                 ingress_event = IngressEvent(
                     trace_id=trace_id,
                     raw=payload,
+                    payload=RawPayload.from_raw(payload),
                     meta={
                         "source": "signalr",
                         "group": self.config.group,
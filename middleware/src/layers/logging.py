@@ -5,19 +5,124 @@ Logging Layer - Handles event logging (Optimized)
 import asyncio
 import json
 import logging
-from logging.handlers import RotatingFileHandler
+import os
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Optional, List, Dict
 import structlog
 from collections import deque
 from datetime import datetime
-import aiofiles
 
 from layers.base import LoggingLayerInterface
 from models.events import MiddlewareEventLog, DeviceIngestLog
 from models.config import LoggingConfig
 
 
+_DATA_PROCESSED = "Data processed | trace_id=%s | object=%s | target_devices=%s"
+_DATA_SENT = "Data sent | device_id=%s | object=%s | value=%s"
+
+
+def _render_entry(entry) -> str:
+    """Render a queued (created, template, args) log entry as a log line"""
+    created, template, args = entry
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(created))
+    return f"{timestamp} | INFO | {template % args}"
+
+
+class _LogBatch:
+    """Queued log entries, rendered to text only when the record is written"""
+    __slots__ = ("entries",)
+
+    def __init__(self, entries: List[tuple]):
+        self.entries = entries
+
+    def __str__(self) -> str:
+        return '\n'.join(map(_render_entry, self.entries))
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves message formatting to the listener thread"""
+
+    def prepare(self, record):
+        return record
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that buffers writes and flushes on an interval or on errors
+
+    The stock handler seeks and flushes after every record; this one keeps a
+    large write buffer, tracks the file size itself for rollover checks and
+    only flushes every flush_interval seconds or when an ERROR is emitted.
+    """
+    
+    def __init__(self, filename, maxBytes=0, backupCount=0, encoding=None,
+                 buffer_size: int = 65536, flush_interval: float = 30.0):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._size = 0
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount, encoding=encoding)
+        
+        self._stop_flush = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, name="log-flush", daemon=True)
+        self._flusher.start()
+    
+    def _open(self):
+        """Open the log file with a large write buffer"""
+        stream = open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                      encoding=self.encoding, errors=self.errors)
+        self._size = os.fstat(stream.fileno()).st_size
+        return stream
+    
+    def emit(self, record):
+        """Write the record into the buffer, flushing right away for errors"""
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            
+            # Rollover against the tracked size in encoded bytes, no seek on the
+            # buffered stream; isascii() is a flag check, so ASCII lines skip the encode
+            size = len(msg) if msg.isascii() else len(msg.encode(self.encoding or 'utf-8', errors='replace'))
+            if self.maxBytes > 0 and self._size + size >= self.maxBytes:
+                self.doRollover()
+            
+            self.stream.write(msg)
+            self._size += size
+            # Only errors are flushed per record, everything else waits for the buffer
+            if record.levelno >= logging.ERROR:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self):
+        """Flush buffered records to disk"""
+        self.acquire()
+        try:
+            if self.stream and hasattr(self.stream, "flush"):
+                self.stream.flush()
+        finally:
+            self.release()
+    
+    def close(self):
+        """Stop the flush thread and close the file, writing out the buffer"""
+        self._stop_flush.set()
+        self.flush()
+        super().close()
+    
+    def _flush_periodically(self):
+        """Background flush so quiet periods still reach the disk"""
+        while not self._stop_flush.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                pass
+
+
 class OptimizedLoggingLayer(LoggingLayerInterface):
     """Optimized Logging Layer with batch processing and async I/O"""
     
@@ -25,7 +130,6 @@ class OptimizedLoggingLayer(LoggingLayerInterface):
         super().__init__("logging_layer")
         self.config = config
         self.logger = structlog.get_logger("logging_layer")
-        self._setup_file_logging()
         
         # Performance optimizations
         self.log_queue = deque(maxlen=10000)  # Log message queue
@@ -33,7 +137,9 @@ class OptimizedLoggingLayer(LoggingLayerInterface):
         self.flush_interval = getattr(config, 'log_flush_interval', 1.0)
         self.enable_async_logging = getattr(config, 'enable_async_logging', True)
         self._batch_task = None
-        self._file_handle = None
+        self._log_event = asyncio.Event()  # Set when log_queue goes non-empty
+        
+        self._setup_file_logging()
         
     def _setup_file_logging(self):
         """Setup optimized file logging with timestamped files"""
@@ -50,14 +156,23 @@ class OptimizedLoggingLayer(LoggingLayerInterface):
         # Store the timestamped log file path
         self.timestamped_log_file = timestamped_log_file
         
-        # Setup rotating file handler for better performance
-        self.file_handler = RotatingFileHandler(
+        # Setup buffered rotating file handler for better performance
+        self.file_handler = BufferedRotatingFileHandler(
             timestamped_log_file,
             maxBytes=self.config.max_size,
             backupCount=self.config.backup_count,
             encoding='utf-8'
         )
         self.file_handler.setLevel(logging.INFO)
+        
+        # Records are only enqueued here; the listener thread does the file I/O
+        record_queue = queue.SimpleQueue()
+        # Standalone logger, kept out of the root hierarchy and its handlers
+        self._event_logger = logging.Logger("logging_layer.events", logging.INFO)
+        self._event_logger.addHandler(_DeferredQueueHandler(record_queue))
+        
+        self._listener = QueueListener(record_queue, self.file_handler, respect_handler_level=True)
+        self._listener.start()
     
     async def start(self):
         """Start logging layer with batch processing"""
@@ -81,21 +196,23 @@ class OptimizedLoggingLayer(LoggingLayerInterface):
             except asyncio.CancelledError:
                 pass
         
-        if self._file_handle:
-            await self._file_handle.close()
+        # Drain queued records, then write out the file buffer
+        self._listener.stop()
+        self.file_handler.close()
     
     async def log_middleware_event(self, event: MiddlewareEventLog):
         """Log middleware event with data transmission details"""
         try:
             self._increment_processed()
             
-            # Create detailed middleware log message
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            log_message = f"{timestamp} | INFO | Data processed | trace_id={event.trace_id} | object={event.object} | target_devices={','.join(event.send_devices)}"
+            # Timestamp and message text are rendered later, off the event loop
+            log_message = (time.time(), _DATA_PROCESSED, (event.trace_id, event.object, ','.join(event.send_devices)))
             
             if self.enable_async_logging:
                 # Add to batch queue
                 self.log_queue.append(log_message)
+                if not self._log_event.is_set():
+                    self._log_event.set()
             else:
                 # Direct logging (fallback)
                 await self._write_log_direct(log_message)
@@ -108,13 +225,14 @@ class OptimizedLoggingLayer(LoggingLayerInterface):
         try:
             self._increment_processed()
             
-            # Create log message
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            log_message = f"{timestamp} | INFO | Data sent | device_id={event.device_id} | object={event.object} | value={event.value}"
+            # Timestamp and message text are rendered later, off the event loop
+            log_message = (time.time(), _DATA_SENT, (event.device_id, event.object, event.value))
             
             if self.enable_async_logging:
                 # Add to batch queue
                 self.log_queue.append(log_message)
+                if not self._log_event.is_set():
+                    self._log_event.set()
             else:
                 # Direct logging (fallback)
                 await self._write_log_direct(log_message)
@@ -127,6 +245,9 @@ class OptimizedLoggingLayer(LoggingLayerInterface):
         while self.is_running:
             try:
                 if not self.log_queue:
+                    # Park until something is queued, then let a batch accumulate
+                    self._log_event.clear()
+                    await self._log_event.wait()
                     await asyncio.sleep(self.flush_interval)
                     continue
                 
@@ -145,38 +266,30 @@ class OptimizedLoggingLayer(LoggingLayerInterface):
                 self.logger.error("Error in batch processing", error=str(e))
                 await asyncio.sleep(0.1)
     
-    async def _write_log_batch(self, batch: List[str]):
+    async def _write_log_batch(self, batch: List[tuple]):
         """Write batch of log messages efficiently"""
         try:
-            # Prepare batch content
-            batch_content = '\n'.join(batch) + '\n'
-            
-            # Async file write to timestamped log file
-            async with aiofiles.open(self.timestamped_log_file, 'a', encoding='utf-8') as f:
-                await f.write(batch_content)
-                await f.flush()
+            # One record per batch; the listener thread renders and writes it
+            self._event_logger.info(_LogBatch(batch))
             
             # Console output (reduced frequency for performance)
             if len(batch) >= 10:  # Only show console logs for larger batches
-                for message in batch[:5]:  # Show first 5 messages
-                    print(message)
-                if len(batch) > 5:
-                    print(f"... and {len(batch) - 5} more messages")
+                lines = [_render_entry(entry) for entry in batch[:5]]  # Show first 5 messages
+                lines.append(f"... and {len(batch) - 5} more messages")
             else:
-                for message in batch:
-                    print(message)
+                lines = [_render_entry(entry) for entry in batch]
+            # One write per batch instead of one per line
+            print('\n'.join(lines))
                     
         except Exception as e:
             self.logger.error("Error writing log batch", error=str(e))
     
-    async def _write_log_direct(self, message: str):
+    async def _write_log_direct(self, entry: tuple):
         """Direct log writing (fallback)"""
         try:
-            async with aiofiles.open(self.timestamped_log_file, 'a', encoding='utf-8') as f:
-                await f.write(message + '\n')
-                await f.flush()
+            self._event_logger.info(_LogBatch([entry]))
             
-            print(message)
+            print(_render_entry(entry))
             
         except Exception as e:
             self.logger.error("Error writing log directly", error=str(e))
@@ -3,11 +3,12 @@ Mapping Layer - Maps input data to objects using mapping catalog
 """
 
 import asyncio
+import traceback
 from typing import Optional, Callable
 import structlog
 
 from layers.base import MappingLayerInterface
-from models.events import IngressEvent, MappedEvent, ValueType
+from models.events import IngressEvent, MappedEvent, RawPayload, ValueType
 from catalogs.mapping_catalog import MappingCatalog
 
 
@@ -32,11 +33,11 @@ class MappingLayer(MappingLayerInterface):
         try:
             self._increment_processed()
             
-            # Extract payload data
-            payload = event.raw.get('payload', {})
-            equip_tag = payload.get('Equip.Tag')
-            message_id = payload.get('Message.ID')
-            value = payload.get('VALUE')
+            # Payload fields are normally extracted once by the input layer
+            payload = event.payload or RawPayload.from_raw(event.raw)
+            equip_tag = payload.equip_tag
+            message_id = payload.message_id
+            value = payload.value
             
             # Validate required fields
             if not all([equip_tag, message_id, value is not None]):
@@ -68,9 +69,9 @@ class MappingLayer(MappingLayerInterface):
             return mapped_event
             
         except Exception as e:
-            self.logger.error("Error in map_event", error=str(e))
-            import traceback
-            self.logger.error("Traceback", traceback=traceback.format_exc())
+            log = self.logger.bind(trace_id=event.trace_id)
+            log.error("Error in map_event", error=str(e))
+            log.error("Traceback", traceback=traceback.format_exc())
             self._increment_error()
             return None
     
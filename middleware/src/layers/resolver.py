@@ -3,7 +3,8 @@ Resolver Layer - Resolves mapped events to target devices
 """
 
 import asyncio
-from typing import Optional, Callable
+import traceback
+from typing import Optional, Callable, List
 import structlog
 
 from layers.base import ResolverLayerInterface
@@ -14,11 +15,12 @@ from catalogs.device_catalog import DeviceCatalog
 class ResolverLayer(ResolverLayerInterface):
     """Resolver Layer - Resolves MappedEvent to target devices"""
     
-    def __init__(self, device_catalog: DeviceCatalog, logging_callback: Callable[[MiddlewareEventLog], None]):
+    def __init__(self, device_catalog: DeviceCatalog, logging_callback: Callable[[MiddlewareEventLog], None],
+                 transports_callback: Optional[Callable[[ResolvedEvent], None]] = None):
         super().__init__("resolver_layer")
         self.device_catalog = device_catalog
         self.logging_callback = logging_callback
-        self.transports_callback = None
+        self.transports_callback = transports_callback
     
     def set_transports_callback(self, callback: Callable[[ResolvedEvent], None]):
         """Set transports layer callback"""
@@ -63,13 +65,15 @@ class ResolverLayer(ResolverLayerInterface):
             
         except Exception as e:
             self._increment_error()
-            self.logger.error("Error resolving event", 
-                            error=str(e), 
-                            trace_id=event.trace_id)
-            import traceback
-            self.logger.error("Traceback", traceback=traceback.format_exc())
+            log = self.logger.bind(trace_id=event.trace_id)
+            log.error("Error resolving event", error=str(e))
+            log.error("Traceback", traceback=traceback.format_exc())
             return None
     
+    async def resolve_batch(self, events: List[MappedEvent]) -> List[Optional[ResolvedEvent]]:
+        """Resolve a batch of mapped events in order"""
+        return [await self.resolve_event(event) for event in events]
+    
     async def _log_middleware_event(self, event: MappedEvent, target_devices: list):
         """Log middleware event"""
         try:
@@ -3,7 +3,9 @@ Transports Layer - MQTT Only
 """
 
 import asyncio
+import functools
 import json
+import logging
 from typing import Optional, Callable, List
 import structlog
 
@@ -15,16 +17,34 @@ from models.config import TransportsConfig
 from catalogs.device_catalog import DeviceCatalog
 
 
+@functools.lru_cache(maxsize=4096)
+def _make_transport_config(device_id: str) -> TransportConfig:
+    """Shared per-device transport config; devices repeat across events"""
+    return TransportConfig(
+        type=TransportType.MQTT,
+        config={
+            'topic': f'devices/{device_id.lower()}/ingress',
+            'qos': 1
+        }
+    )
+
+
 class MQTTTransport:
     """MQTT transport handler"""
     
-    def __init__(self, config):
+    def __init__(self, config, client: Optional[MQTTClient] = None):
         self.config = config
         self.logger = structlog.get_logger("mqtt_transport")
-        self.client = None
+        self.client = client
+        self._owns_client = client is None  # A shared client stays connected between batches
     
     async def send_to_device(self, device_target: DeviceTarget) -> bool:
         """Send data to device via MQTT"""
+        results = await self.send_batch([device_target])
+        return results[0]
+    
+    async def send_batch(self, device_targets: List[DeviceTarget]) -> List[bool]:
+        """Send data to several devices over a single broker session"""
         try:
             if not self.client:
                 self.client = MQTTClient(
@@ -35,6 +55,24 @@ class MQTTTransport:
                     keepalive=self.config.keepalive
                 )
             
+            # Send messages
+            if self._owns_client:
+                async with self.client:
+                    return await self._publish_all(device_targets)
+            return await self._publish_all(device_targets)
+            
+        except Exception as e:
+            # Connecting failed, nothing in the batch was published
+            self.logger.error("Error sending MQTT message",
+                            device_ids=[t.device_id for t in device_targets],
+                            error=str(e))
+            return [False] * len(device_targets)
+    
+    async def _publish_all(self, device_targets: List[DeviceTarget]) -> List[bool]:
+        """Publish each target on the connected client, returns a result per target"""
+        results = []
+        errors = {}
+        for device_target in device_targets:
             # Get device-specific topic
             device_config = device_target.transport_config.config
             topic = device_config.get('topic', f"devices/{device_target.device_id}/ingress")
@@ -45,37 +83,36 @@ class MQTTTransport:
                 "value": device_target.value
             }
             
-            # Send message
-            async with self.client:
-                
+            try:
                 await self.client.publish(
                     topic,
                     payload=json.dumps(payload),
                     qos=device_config.get('qos', 1)
                 )
-                
-            
-            # Log removed - only file log will show Data sent
-            
-            return True
-            
-        except Exception as e:
-            self.logger.error("Error sending MQTT message",
-                            device_id=device_target.device_id,
-                            error=str(e))
-            return False
+                results.append(True)
+            except Exception as e:
+                # Earlier publishes in the batch went out; only this one failed
+                errors[device_target.device_id] = str(e)
+                results.append(False)
+        
+        # One log line per batch, not per failed device
+        if errors:
+            self.logger.error("Error sending MQTT message", errors=errors)
+        return results
 
 
 class TransportsLayer(TransportsLayerInterface):
     """Transports Layer - MQTT Only"""
     
-    def __init__(self, config: TransportsConfig, device_catalog: DeviceCatalog, device_ingest_callback: Callable[[DeviceIngestLog], None]):
+    def __init__(self, config: TransportsConfig, device_catalog: DeviceCatalog, device_ingest_callback: Callable[[DeviceIngestLog], None], mqtt_client: Optional[MQTTClient] = None):
         super().__init__("transports_layer")
         self.config = config
         self.device_catalog = device_catalog
         self.device_ingest_callback = device_ingest_callback
+        self.mqtt_client = mqtt_client
         self.transport = None
         self.is_running = False
+        self._debug_enabled = False
     
     async def start(self):
         """Start transports layer"""
@@ -83,7 +120,10 @@ class TransportsLayer(TransportsLayerInterface):
             if not self.config.mqtt:
                 raise ValueError("MQTT configuration is required")
             
-            self.transport = MQTTTransport(self.config.mqtt)
+            self.transport = MQTTTransport(self.config.mqtt, client=self.mqtt_client)
+            
+            # Resolved once; skips building debug kwargs per event when DEBUG is off
+            self._debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
             self.is_running = True
             
         except Exception as e:
@@ -96,70 +136,65 @@ class TransportsLayer(TransportsLayerInterface):
     
     async def send_to_devices(self, event: ResolvedEvent):
         """Send resolved event to target devices"""
-        try:
+        await self.send_batch([event])
+    
+    async def send_batch(self, events: List[ResolvedEvent]):
+        """Send several resolved events to their target devices in one broker session"""
+        # Create device targets, remembering which event each belongs to
+        device_targets = []
+        target_events = []
+        for event in events:
             self._increment_processed()
             
-            self.logger.debug("Sending to devices",
-                            trace_id=event.trace_id,
-                            object=event.object,
-                            target_devices=event.target_devices)
+            if self._debug_enabled:
+                self.logger.debug("Sending to devices",
+                                trace_id=event.trace_id,
+                                object=event.object,
+                                target_devices=event.target_devices)
             
-            # Create device targets
-            device_targets = []
             for device_id in event.target_devices:
-                # Create transport config (simplified - no device profile needed)
-                transport_config = TransportConfig(
-                    type=TransportType.MQTT,
-                    config={
-                        'topic': f'devices/{device_id.lower()}/ingress',
-                        'qos': 1
-                    }
-                )
+                # Get cached transport config (simplified - no device profile needed)
+                transport_config = _make_transport_config(device_id)
                 
-                # Create device target
-                device_target = DeviceTarget(
+                device_targets.append(DeviceTarget(
                     device_id=device_id,
                     transport_config=transport_config,
                     object=event.object,
                     value=event.value
-                )
-                
-                device_targets.append(device_target)
-            
-            # Send to all devices
-            success_count = 0
-            for device_target in device_targets:
-                try:
-                    # No console log - only file log
-                    
-                    success = await self.transport.send_to_device(device_target)
-                    if success:
-                        success_count += 1
-                        # No console log - only file log
-                        
-                        # Log device ingest
-                        ingest_log = DeviceIngestLog(
-                            trace_id=event.trace_id,
-                            device_id=device_target.device_id,
-                            object=device_target.object,
-                            value=device_target.value
-                        )
-                        await self.device_ingest_callback(ingest_log)
-                    else:
-                        self.logger.warning("TRANSPORTS LAYER: Failed to deliver to device", 
-                                          trace_id=event.trace_id,
-                                          device_id=device_target.device_id)
-                        
-                except Exception as e:
-                    self.logger.error("TRANSPORTS LAYER: Error delivering to device",
-                                    trace_id=event.trace_id,
-                                    device_id=device_target.device_id,
-                                    error=str(e))
-            
+                ))
+                target_events.append(event)
+        
+        if not device_targets:
+            return
+        
+        try:
             # No console log - only file log
-            
+            results = await self.transport.send_batch(device_targets)
         except Exception as e:
             self._increment_error()
             self.logger.error("Error in send_to_devices",
-                            trace_id=event.trace_id,
-                            error=str(e))
\ No newline at end of file
+                            trace_ids=[event.trace_id for event in events],
+                            error=str(e))
+            return
+        
+        for device_target, event, success in zip(device_targets, target_events, results):
+            try:
+                if success:
+                    # Log device ingest
+                    ingest_log = DeviceIngestLog(
+                        trace_id=event.trace_id,
+                        device_id=device_target.device_id,
+                        object=device_target.object,
+                        value=device_target.value
+                    )
+                    await self.device_ingest_callback(ingest_log)
+                else:
+                    self.logger.warning("TRANSPORTS LAYER: Failed to deliver to device", 
+                                      trace_id=event.trace_id,
+                                      device_id=device_target.device_id)
+                    
+            except Exception as e:
+                self.logger.error("TRANSPORTS LAYER: Error delivering to device",
+                                trace_id=event.trace_id,
+                                device_id=device_target.device_id,
+                                error=str(e))
@@ -3,28 +3,82 @@ Transports Layer - SignalR Sends resolved events to target devices (Optimized)
 """
 
 import asyncio
+import functools
 import json
+import random
+import threading
+import time
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, Callable, List, Any, Dict
 import structlog
 from collections import defaultdict, deque
 import weakref
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from signalrcore.hub_connection_builder import HubConnectionBuilder
     from signalrcore.hub.base_hub_connection import BaseHubConnection
     SIGNALR_AVAILABLE = True
+    SIGNALR_IMPORT_ERROR = None
 except ImportError as e:
-    print(f"SignalR import error: {e}")
+    # Reported when a SignalR handler is constructed, not at import time
     SIGNALR_AVAILABLE = False
+    SIGNALR_IMPORT_ERROR = e
     HubConnectionBuilder = None
     BaseHubConnection = None
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 from layers.base import TransportsLayerInterface
 from models.events import ResolvedEvent, TransportEvent, DeviceTarget, TransportConfig, TransportType, DeviceIngestLog, LayerResult
 from models.config import TransportsConfig
 from catalogs.device_catalog import DeviceCatalog
+from utils.async_batcher import AsyncBatcher
+
+
+# Pre-encoded static payload keys: {"object":...,"value":...,"timestamp":...}
+_PAYLOAD_PREFIX = b'{"object":'
+_PAYLOAD_MID1 = b',"value":'
+_PAYLOAD_MID2 = b',"timestamp":'
+_PAYLOAD_SUF = b'}'
+
+
+def _dumps(obj: Any) -> bytes:
+    """Encode a single JSON value to bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+@functools.lru_cache(maxsize=1)
+def _iso_timestamp(epoch_second: int) -> str:
+    """UTC ISO timestamp, memoized for the current second"""
+    return datetime.fromtimestamp(epoch_second, tz=timezone.utc).isoformat()
+
+
+@functools.lru_cache(maxsize=4096)
+def _make_transport_config(device_id: str, target: str) -> TransportConfig:
+    """Shared per-device transport config; devices repeat across events"""
+    return TransportConfig(
+        type=TransportType.SIGNALR,
+        config={'group': device_id, 'target': target}
+    )
+
+
+def _encode_payload(object_name: str, value: Any, timestamp: str) -> bytes:
+    """Build the device payload frame without re-encoding the key strings"""
+    return b"".join((
+        _PAYLOAD_PREFIX, _dumps(object_name),
+        _PAYLOAD_MID1, _dumps(value),
+        _PAYLOAD_MID2, _dumps(timestamp),
+        _PAYLOAD_SUF
+    ))
 
 
 class SignalRTransportPool:
@@ -37,6 +91,10 @@ class SignalRTransportPool:
         self.active_connections = 0
         self.logger = structlog.get_logger("signalr_transport_pool")
         self._connection_refs = weakref.WeakSet()
+        self.open_timeout = 5.0
+        self._connection_returned = asyncio.Event()  # Wakes get_connection waiters
+        # signalrcore's stop() tears down the websocket synchronously
+        self._close_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="signalr-close")
         
     async def get_connection(self) -> BaseHubConnection:
         """Get connection from pool or create new one"""
@@ -49,175 +107,202 @@ class SignalRTransportPool:
             self._connection_refs.add(connection)
             return connection
         
-        # Wait for available connection
+        # Park until a connection is returned instead of polling
         while not self.connections:
-            await asyncio.sleep(0.01)
+            self._connection_returned.clear()
+            await self._connection_returned.wait()
         return self.connections.popleft()
     
     async def return_connection(self, connection: BaseHubConnection):
         """Return connection to pool"""
         if connection and self._is_connection_healthy(connection):
             self.connections.append(connection)
+            self._connection_returned.set()
         else:
             self.active_connections -= 1
             self._connection_refs.discard(connection)
     
     async def _create_connection(self) -> BaseHubConnection:
         """Create optimized SignalR connection"""
+        loop = asyncio.get_running_loop()
+        loop_thread = threading.get_ident()
+        opened = asyncio.Event()
+        
+        # Let signalrcore reconnect in place instead of rebuilding the connection
         connection = HubConnectionBuilder() \
             .with_url(self.config.url) \
+            .with_automatic_reconnect({
+                "type": "raw",
+                "keep_alive_interval": self.config.keepalive_interval,
+                "reconnect_interval": self.config.retry_delay,
+                "max_attempts": self.config.max_retry_attempts
+            }) \
             .build()
         
+        def on_open():
+            self.logger.debug("SignalR transport connection opened")
+            if threading.get_ident() == loop_thread:
+                opened.set()
+            else:
+                # Callback normally runs on the signalrcore thread
+                loop.call_soon_threadsafe(opened.set)
+        
         # Optimized event handlers
-        connection.on_open(lambda: self.logger.debug("SignalR transport connection opened"))
+        connection.on_open(on_open)
         connection.on_close(lambda: self.logger.debug("SignalR transport connection closed"))
         connection.on_error(lambda data: self.logger.error("SignalR transport connection error", error=data))
+        connection.on_reconnect(lambda: self.logger.debug("SignalR transport connection reconnected"))
         
         connection.start()
         
-        # Non-blocking wait
-        await asyncio.sleep(0.3)
+        # Wait for the hub handshake instead of a fixed delay
+        try:
+            await asyncio.wait_for(opened.wait(), timeout=self.open_timeout)
+        except asyncio.TimeoutError:
+            self.logger.warning("SignalR transport connection did not open in time",
+                              timeout=self.open_timeout)
         
         return connection
     
     def _is_connection_healthy(self, connection: BaseHubConnection) -> bool:
-        """Check connection health"""
+        """Check connection health through the transport's public state"""
         try:
-            if hasattr(connection, 'transport') and hasattr(connection.transport, '_ws'):
-                return connection.transport._ws and connection.transport._ws.sock
+            return connection.transport.is_running()
+        except Exception:
             return False
+    
+    async def _stop_connection(self, connection: BaseHubConnection):
+        """Stop a connection off the event loop thread"""
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(self._close_executor, connection.stop)
         except:
-            return False
+            pass
     
     async def close_all(self):
         """Close all connections"""
-        for connection in self.connections:
-            try:
-                connection.stop()
-            except:
-                pass
+        connections = list(self.connections)
         self.connections.clear()
+        await asyncio.gather(*(self._stop_connection(c) for c in connections))
         self.active_connections = 0
 
 
+class SignalRSendBatcher(AsyncBatcher):
+    """Batches (group, target, payload_frame) sends into SignalR hub invocations"""
+    
+    def __init__(self, transport: "SignalRTransport", max_batch_size: int = 64, max_queue_time: float = 0.05):
+        super().__init__(max_batch_size=max_batch_size, max_queue_time=max_queue_time, name="signalr_send_batcher")
+        self.transport = transport
+        self._group_locks: Dict[str, asyncio.Lock] = {}
+    
+    async def process_batch(self, items: List[tuple]):
+        """Group items by (group, target) and send one hub invocation per group"""
+        groups = defaultdict(list)
+        for group, target, frame in items:
+            groups[(group, target)].append(frame)
+        
+        connection = self.transport._connection
+        results = await asyncio.gather(
+            *(self._send_group(connection, group, target, frames) for (group, target), frames in groups.items()),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+    
+    async def _send_group(self, connection: BaseHubConnection, group: str, target: str, frames: List[bytes]):
+        """Send one group's frames; only sends to the same group are ordered"""
+        lock = self._group_locks.get(group)
+        if lock is None:
+            lock = self._group_locks[group] = asyncio.Lock()
+        
+        if len(frames) == 1:
+            method, message = "SendMessage", frames[0]
+        else:
+            # Frames are already JSON, so the batch array is a plain join
+            method, message = "SendBatchMessages", b"[" + b",".join(frames) + b"]"
+        
+        # Websocket writes block, keep them off the event loop thread
+        loop = asyncio.get_running_loop()
+        async with lock:
+            await loop.run_in_executor(
+                self.transport._send_executor,
+                self._invoke, connection, method, group, target, message
+            )
+    
+    def _invoke(self, connection: BaseHubConnection, method: str, group: str, target: str, message: bytes):
+        """Invoke a hub method; the payload is already JSON, so only the decode is left"""
+        # signalrcore encodes the invocation and owns the socket across reconnects
+        connection.send(method, [group, target, message.decode('utf-8')])
+
+
 class SignalRTransport:
     """Optimized SignalR transport handler with batching and connection pooling"""
     
     def __init__(self, config):
         self.config = config
         self.logger = structlog.get_logger("signalr_transport")
+        if not SIGNALR_AVAILABLE:
+            self.logger.error("SignalR is not available. Please install signalrcore library.",
+                            error=str(SIGNALR_IMPORT_ERROR))
+            raise ImportError("SignalR library not available")
         self.connection_pool = SignalRTransportPool(config, max_connections=5)
-        self.message_batches = defaultdict(list)  # Group messages by device group
-        self.batch_size = 20
-        self.batch_timeout = 0.05  # 50ms batch timeout
-        self._batch_tasks = {}
+        self._batcher = SignalRSendBatcher(self, max_batch_size=64, max_queue_time=0.05)
         self._connection = None
-        
-    async def send_to_device(self, device_target: DeviceTarget) -> bool:
-        """Send data to device via SignalR with batching"""
-        try:
-            if not self._connection:
-                self._connection = await self.connection_pool.get_connection()
-            
-            # Get device configuration
-            device_config = device_target.transport_config.config
-            group = device_config.get('group', device_target.device_id)
-            target = device_config.get('target', 'ingress')
-            
-            # Prepare payload
-            payload = {
-                "object": device_target.object,
-                "value": device_target.value,
-                "timestamp": asyncio.get_event_loop().time()
-            }
-            
-            # Add to batch
-            self.message_batches[group].append({
-                'target': target,
-                'payload': payload,
-                'device_id': device_target.device_id
-            })
-            
-            # Start batch processing if not already running
-            if group not in self._batch_tasks:
-                self._batch_tasks[group] = asyncio.create_task(
-                    self._process_batch_for_group(group)
-                )
-            
-            return True
-            
-        except Exception as e:
-            self.logger.error("Error queuing SignalR message",
-                            device_id=device_target.device_id,
-                            error=str(e))
-            return False
+        self._connection_lock = asyncio.Lock()
+        self._reconnect_delay = 1.0
+        self._next_connect_at = 0.0
+        self._send_executor = ThreadPoolExecutor(
+            max_workers=getattr(config, 'send_workers', 4),
+            thread_name_prefix="sr-send"
+        )
     
-    async def _process_batch_for_group(self, group: str):
-        """Process batched messages for a specific group"""
-        try:
-            while self.message_batches[group]:
-                # Collect batch
-                batch = []
-                for _ in range(min(self.batch_size, len(self.message_batches[group]))):
-                    if self.message_batches[group]:
-                        batch.append(self.message_batches[group].pop(0))
-                
-                if batch:
-                    await self._send_batch(group, batch)
-                
-                # Wait for more messages or timeout
-                if not self.message_batches[group]:
-                    await asyncio.sleep(self.batch_timeout)
-                    if not self.message_batches[group]:
-                        break
-                        
-        except Exception as e:
-            self.logger.error("Error processing batch for group", group=group, error=str(e))
-        finally:
-            # Clean up batch task
-            if group in self._batch_tasks:
-                del self._batch_tasks[group]
+    async def _ensure_connection(self) -> BaseHubConnection:
+        """Get a pooled connection once, even with concurrent senders"""
+        if self._connection is None:
+            async with self._connection_lock:
+                if self._connection is None:
+                    now = time.monotonic()
+                    if now < self._next_connect_at:
+                        raise ConnectionError("SignalR transport is backing off before reconnecting")
+                    
+                    try:
+                        self._connection = await self.connection_pool.get_connection()
+                    except Exception:
+                        # Jittered exponential backoff so nodes don't reconnect in lockstep
+                        delay = self._reconnect_delay
+                        self._next_connect_at = now + delay - random.uniform(0, delay / 4)
+                        self._reconnect_delay = min(delay * 2, 30)
+                        raise
+                    
+                    self._reconnect_delay = 1.0
+        return self._connection
     
-    async def _send_batch(self, group: str, batch: List[Dict]):
-        """Send batch of messages efficiently"""
-        try:
-            if len(batch) == 1:
-                # Single message
-                message = batch[0]
-                self._connection.send("SendMessage", [
-                    group, 
-                    message['target'], 
-                    json.dumps(message['payload'])
-                ])
-            else:
-                # Batch message
-                batch_payloads = [msg['payload'] for msg in batch]
-                self._connection.send("SendBatchMessages", [
-                    group,
-                    batch[0]['target'],  # All messages in batch have same target
-                    json.dumps(batch_payloads)
-                ])
-                
-        except Exception as e:
-            self.logger.error("Error sending batch", group=group, error=str(e))
-            # Fallback to individual messages
-            for message in batch:
-                try:
-                    self._connection.send("SendMessage", [
-                        group,
-                        message['target'],
-                        json.dumps(message['payload'])
-                    ])
-                except Exception as e2:
-                    self.logger.error("Error sending individual message", 
-                                    device_id=message.get('device_id'), 
-                                    error=str(e2))
+    def build_payload(self, object_name: str, value: Any) -> bytes:
+        """Pre-serialize a payload frame that can be shared across devices"""
+        return _encode_payload(object_name, value, _iso_timestamp(int(time.time())))
+        
+    async def send_to_device(self, device_target: DeviceTarget, payload: Optional[bytes] = None) -> bool:
+        """Queue data for a device; the batcher flushes it to SignalR
+
+        Connection errors propagate so the caller can report them once per event.
+        """
+        await self._ensure_connection()
+        
+        # Group and target are resolved by the caller, no config dict lookups
+        group = device_target.group or device_target.device_id
+        target = device_target.target or 'ingress'
+        
+        # Prepare pre-encoded payload frame unless the caller shared one
+        if payload is None:
+            payload = self.build_payload(device_target.object, device_target.value)
+        
+        return self._batcher.add((group, target, payload))
     
     async def close(self):
         """Close transport and cleanup"""
-        # Wait for all batch tasks to complete
-        if self._batch_tasks:
-            await asyncio.gather(*self._batch_tasks.values(), return_exceptions=True)
+        # Flush queued messages and wait for in-flight batches
+        await self._batcher.close()
         
         # Return connection to pool
         if self._connection:
@@ -225,6 +310,9 @@ class SignalRTransport:
         
         # Close all connections
         await self.connection_pool.close_all()
+        
+        # Batches are flushed, release send threads
+        self._send_executor.shutdown(wait=False)
 
 
 class TransportsLayer(TransportsLayerInterface):
@@ -238,6 +326,10 @@ class TransportsLayer(TransportsLayerInterface):
         self.transport = None
         self.is_running = False
         
+        # Resolve callback dispatch once instead of per device
+        self._callback_is_async = asyncio.iscoroutinefunction(device_ingest_callback)
+        self._callback_inline = getattr(config, 'ingest_callback_inline', False)
+        
         if not self.config.signalr:
             raise ValueError("SignalR configuration is required")
         self.transport = SignalRTransport(self.config.signalr)
@@ -252,37 +344,81 @@ class TransportsLayer(TransportsLayerInterface):
         self._increment_processed()
         device_targets = []
         for device_id in event.target_devices:
-            transport_config = TransportConfig(
-                type=TransportType.SIGNALR,
-                config={'group': device_id, 'target': 'ingress'}
-            )
-            device_target = DeviceTarget(device_id=device_id, transport_config=transport_config, object=event.object, value=event.value)
+            transport_config = _make_transport_config(device_id, 'ingress')
+            device_target = DeviceTarget(device_id=device_id, transport_config=transport_config, object=event.object, value=event.value, group=device_id, target='ingress')
             device_targets.append(device_target)
         
-        success_count = 0
-        for device_target in device_targets:
-            try:
-                success = await self.transport.send_to_device(device_target)
-                if success:
-                    success_count += 1
-                    
-                    # Log device ingest
-                    ingest_log = DeviceIngestLog(
-                        trace_id=event.trace_id,
-                        device_id=device_target.device_id,
-                        object=device_target.object,
-                        value=device_target.value
-                    )
-                    await self.device_ingest_callback(ingest_log)
+        # Payload body is identical for every device, serialize it once
+        payload = self.transport.build_payload(event.object, event.value)
+        results = await asyncio.gather(
+            *(self.transport.send_to_device(device_target, payload) for device_target in device_targets),
+            return_exceptions=True
+        )
+        
+        ingest_callback = self.device_ingest_callback
+        ingest_coros = []
+        sync_logs = []
+        # Failures are collected and logged once per event, not per device
+        failed_devices = []
+        errored_devices = {}
+        for device_target, success in zip(device_targets, results):
+            if isinstance(success, Exception):
+                errored_devices[device_target.device_id] = str(success)
+            elif success:
+                # Log device ingest
+                ingest_log = DeviceIngestLog(
+                    trace_id=event.trace_id,
+                    device_id=device_target.device_id,
+                    object=device_target.object,
+                    value=device_target.value
+                )
+                if self._callback_is_async:
+                    ingest_coros.append(ingest_callback(ingest_log))
+                elif self._callback_inline:
+                    self._run_sync_ingest(event.trace_id, [ingest_log])
                 else:
-                    self.logger.warning("TRANSPORTS LAYER: Failed to deliver to device", 
-                                      trace_id=event.trace_id,
-                                      device_id=device_target.device_id)
-                    
-            except Exception as e:
-                self.logger.error("TRANSPORTS LAYER: Error delivering to device",
-                                trace_id=event.trace_id,
-                                device_id=device_target.device_id,
-                                error=str(e))
+                    sync_logs.append(ingest_log)
+            else:
+                failed_devices.append(device_target.device_id)
+        
+        # Only failures are tallied; with batching, queued sends count as delivered
+        error_count = len(failed_devices) + len(errored_devices)
+        # trace_id is bound once, and only for events that have something to report
+        log = None
+        if error_count:
+            log = self.logger.bind(trace_id=event.trace_id)
+            if failed_devices:
+                log.warning("TRANSPORTS LAYER: Failed to deliver to devices",
+                            device_ids=failed_devices)
+            if errored_devices:
+                log.error("TRANSPORTS LAYER: Error delivering to devices",
+                          errors=errored_devices)
+        
+        # Slow sync callbacks share a single executor hop per event
+        if sync_logs:
+            ingest_coros.append(asyncio.get_running_loop().run_in_executor(
+                None, self._run_sync_ingest, event.trace_id, sync_logs
+            ))
+        
+        # Ingest logging is independent per device, await it in one go
+        if ingest_coros:
+            for result in await asyncio.gather(*ingest_coros, return_exceptions=True):
+                if isinstance(result, Exception):
+                    if log is None:
+                        log = self.logger.bind(trace_id=event.trace_id)
+                    log.error("TRANSPORTS LAYER: Error logging device ingest",
+                              error=str(result))
         
-        return LayerResult(success=success_count > 0, processed_count=len(device_targets), error_count=len(device_targets) - success_count, data=device_targets)
\ No newline at end of file
+        processed_count = len(device_targets)
+        return LayerResult(success=error_count < processed_count, processed_count=processed_count, error_count=error_count, data=device_targets)
+    
+    def _run_sync_ingest(self, trace_id: str, ingest_logs: List[DeviceIngestLog]):
+        """Call a synchronous ingest callback for each log"""
+        for ingest_log in ingest_logs:
+            try:
+                self.device_ingest_callback(ingest_log)
+            except Exception as e:
+                self.logger.error("TRANSPORTS LAYER: Error logging device ingest",
+                                trace_id=trace_id,
+                                device_id=ingest_log.device_id,
+                                error=str(e))
\ No newline at end of file
@@ -4,16 +4,72 @@ IoT Data Bridge - MQTT Only Main Entry Point
 """
 
 import asyncio
+import contextlib
+import json
 import logging
+import os
 import signal
+import socket
 import sys
+from collections import deque
 from pathlib import Path
+from typing import Optional
 
 # Add src directory to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
 import structlog
-import yaml
+from aiomqtt import Client as MQTTClient
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+def _console_line(event_dict) -> str:
+    """Console line matching file log format"""
+    # Data sent lines are written by the logging layer's stdlib logger, so
+    # structlog records only need their event text
+    return event_dict.get('event', '')
+
+
+def _console_formatter(logger, method_name, event_dict):
+    """structlog renderer producing the console line"""
+    return _console_line(event_dict)
+
+
+def _json_renderer(logger, method_name, event_dict):
+    """structlog renderer producing one JSON line, as bytes when orjson is available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(event_dict, default=str)
+    return json.dumps(event_dict, default=str)
+
+
+# mosquitto.conf locations tried after the one next to the app config
+_MOSQUITTO_CONF_FALLBACKS = (
+    Path("mosquitto.conf"),  # current directory
+    Path("../mosquitto.conf"),  # parent directory
+)
+
+# Pid file written by the daemonised broker (pid_file in mosquitto.conf)
+_MOSQUITTO_PID_FILE = Path("/tmp/iot-mosquitto.pid")
+
+# Fallback broker cleanup commands, tried in order until the port is free.
+# Only commands that match mosquitto by name; nothing kills by port alone
+_BROKER_CLEANUP_STEPS = (
+    ("pkill", "mosquitto"),
+)
+
+# Upper bound on how long shutdown waits for queued events to be delivered
+_DRAIN_TIMEOUT = 5.0
 
 from layers.input_mqtt import InputLayer
 from layers.mapping import MappingLayer
@@ -23,7 +79,8 @@ from layers.logging import LoggingLayer
 from catalogs.mapping_catalog import MappingCatalog
 from catalogs.device_catalog import DeviceCatalog
 from models.config import AppConfig
-from models.events import IngressEvent, MappedEvent, ResolvedEvent, MiddlewareEventLog, DeviceIngestLog
+from utils.console_echo import echo_warnings
+from utils.yaml_cache import load_yaml_cached
 
 
 class IoTDataBridge:
@@ -33,7 +90,9 @@ class IoTDataBridge:
         self.config_path = config_path
         self.config = None
         self.logger = None
+        self._log_stream = None
         self.running = False
+        self._stop_event = asyncio.Event()
         
         # Layers
         self.input_layer = None
@@ -46,6 +105,17 @@ class IoTDataBridge:
         self.mapping_catalog = None
         self.device_catalog = None
         
+        # Bounded queues between layers decouple producer and consumer rates
+        self._mapped_queue = asyncio.Queue(maxsize=1024)
+        self._resolved_queue = asyncio.Queue(maxsize=1024)
+        self._worker_tasks = []
+        self._broker_output_task = None
+        self._mosquitto_conf: Optional[Path] = None
+        
+        # Broker connection shared by input and transports when they target the same broker
+        self.mqtt_client: Optional[MQTTClient] = None
+        self._mqtt_stack: Optional[contextlib.AsyncExitStack] = None
+        
     async def initialize(self):
         """Initialize the application"""
         try:
@@ -62,7 +132,8 @@ class IoTDataBridge:
             await self._initialize_layers()
             
             # Start MQTT broker
-            self._start_mqtt_broker()
+            self._mosquitto_conf = self._resolve_mosquitto_conf()
+            await self._start_mqtt_broker()
             
         except Exception as e:
             print(f"Failed to initialize IoT Data Bridge: {e}")
@@ -74,58 +145,55 @@ class IoTDataBridge:
         if not config_file.exists():
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
         
-        with open(config_file, 'r', encoding='utf-8') as f:
-            config_data = yaml.safe_load(f)
+        # Parsed config is cached next to the YAML as JSON and reused while the
+        # file's mtime and size match; read and parse in one worker-thread hop
+        config_data = await asyncio.to_thread(load_yaml_cached, config_file)
         
         self.config = AppConfig(**config_data)
     
     def _setup_logging(self):
         """Setup structured logging"""
-        # Custom formatter for console logs (same as file format)
-        def console_formatter(logger, method_name, event_dict):
-            """Console formatter matching file log format"""
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            message = event_dict.get('event', '')
-            
-            # Extract key fields
-            device_id = event_dict.get('device_id', '')
-            object_name = event_dict.get('object', '')
-            value = event_dict.get('value', '')
-            
-            # Show Data sent logs in console with proper format
-            if message == "Data sent" and device_id and object_name and value != '':
-                return f"Data sent | device_id={device_id} | object={object_name} | value={value}"
-            else:
-                # Show other important logs normally
-                return message
+        level = getattr(logging, self.config.logging.level.upper())
         
-        structlog.configure(
-            processors=[
-                structlog.stdlib.filter_by_level,
-                structlog.stdlib.add_log_level,
-                structlog.processors.TimeStamper(fmt="%H:%M:%S"),
-                structlog.processors.format_exc_info,
-                structlog.processors.UnicodeDecoder(),
-                console_formatter
-            ],
-            context_class=dict,
-            logger_factory=structlog.stdlib.LoggerFactory(),
-            wrapper_class=structlog.stdlib.BoundLogger,
-            cache_logger_on_first_use=True,
-        )
+        # Root level mirrors the configured level so layers can cheaply check isEnabledFor
+        logging.getLogger().setLevel(level)
         
-        # Setup file logging
         log_file = Path(self.config.logging.file)
         log_file.parent.mkdir(parents=True, exist_ok=True)
         
-        logging.basicConfig(
-            level=getattr(logging, self.config.logging.level.upper()),
-            format='%(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler()
+        # Filtering wrapper turns calls below the configured level into no-ops, so
+        # only records that will be written reach the processors. The console
+        # formatter renders just the event text; timestamp, exc_info and
+        # unicode-decoding processors only produced keys it dropped
+        if self.config.logging.json_format:
+            processors = [
+                structlog.processors.add_log_level,
+                structlog.processors.TimeStamper(fmt="iso"),
+                _json_renderer,
+                echo_warnings
+            ]
+        else:
+            processors = [
+                _console_formatter,
+                echo_warnings
             ]
+        
+        # orjson JSON lines are written as bytes straight to a binary handle,
+        # skipping the decode/encode round trip; text lines use a pre-opened,
+        # line-buffered handle
+        if self.config.logging.json_format and ORJSON_AVAILABLE:
+            self._log_stream = open(log_file, 'ab')
+            logger_factory = structlog.BytesLoggerFactory(file=self._log_stream)
+        else:
+            self._log_stream = open(log_file, 'a', buffering=1, encoding='utf-8')
+            logger_factory = structlog.WriteLoggerFactory(file=self._log_stream)
+        
+        structlog.configure(
+            processors=processors,
+            context_class=dict,
+            logger_factory=logger_factory,
+            wrapper_class=structlog.make_filtering_bound_logger(level),
+            cache_logger_on_first_use=True,
         )
         
         self.logger = structlog.get_logger("iot_data_bridge")
@@ -134,171 +202,424 @@ class IoTDataBridge:
     async def _initialize_catalogs(self):
         """Initialize mapping and device catalogs"""
         self.mapping_catalog = MappingCatalog(self.config.mapping_catalog_path)
-        await self.mapping_catalog.load()
-        
         self.device_catalog = DeviceCatalog(self.config.device_catalog_path)
-        await self.device_catalog.load()
+        
+        # Catalogs are independent, load them concurrently
+        await asyncio.gather(self.mapping_catalog.load(), self.device_catalog.load())
     
     async def _initialize_layers(self):
         """Initialize all layers"""
         # Initialize logging layer first
         self.logging_layer = LoggingLayer(self.config.logging)
         
+        # One persistent connection for subscribe and publish when possible
+        self.mqtt_client = self._create_shared_mqtt_client()
+        
         # Initialize transports layer
         self.transports_layer = TransportsLayer(
             self.config.transports,
             self.device_catalog,
-            self._log_device_ingest
+            self.logging_layer.log_device_ingest,
+            mqtt_client=self.mqtt_client
         )
         
-        # Initialize resolver layer
+        # Callbacks are bound directly: mapped and resolved events go straight
+        # onto the worker queues, ingress straight into the mapping layer
+        
+        # Initialize resolver layer, wired once to logging and transports
         self.resolver_layer = ResolverLayer(
             self.device_catalog,
-            self._log_middleware_event
+            self.logging_layer.log_middleware_event,
+            transports_callback=self._resolved_queue.put
         )
         
-        # Set resolver -> transports callback
-        self.resolver_layer.set_transports_callback(self._handle_resolved_event)
-        
         # Initialize mapping layer
         self.mapping_layer = MappingLayer(
             self.mapping_catalog,
-            self._handle_mapped_event
+            self._mapped_queue.put
         )
         
         # Initialize input layer (MQTT only)
         self.input_layer = InputLayer(
             self.config.input,
-            self._handle_ingress_event
+            self.mapping_layer.map_event,
+            mqtt_client=self.mqtt_client
         )
     
-    async def _handle_ingress_event(self, event: IngressEvent):
-        """Handle ingress event from input layer"""
-        # Extract raw data for logging
-        raw_payload = event.raw.get('payload', {})
-        equip_tag = raw_payload.get('Equip.Tag', 'Unknown')
-        message_id = raw_payload.get('Message.ID', 'Unknown')
-        raw_value = raw_payload.get('VALUE', 'Unknown')
-        
-        # No console log - only file log
-        await self.mapping_layer.map_event(event)
+    def _create_shared_mqtt_client(self) -> Optional[MQTTClient]:
+        """Build one client for input and transports if both use the same broker and credentials"""
+        input_mqtt = self.config.input.mqtt
+        transports_mqtt = self.config.transports.mqtt
+        if not input_mqtt or not transports_mqtt:
+            return None
+        
+        def broker_key(mqtt_config):
+            return (mqtt_config.host, mqtt_config.port, mqtt_config.username, mqtt_config.password)
+        
+        if broker_key(input_mqtt) != broker_key(transports_mqtt):
+            return None
+        
+        return MQTTClient(
+            hostname=input_mqtt.host,
+            port=input_mqtt.port,
+            username=input_mqtt.username,
+            password=input_mqtt.password,
+            keepalive=input_mqtt.keepalive
+        )
     
-    async def _handle_mapped_event(self, event: MappedEvent):
-        """Handle mapped event from mapping layer"""
-        # No console log - only file log
-        await self.resolver_layer.resolve_event(event)
+    async def _resolver_worker(self):
+        """Resolve mapped events pulled from the mapped queue in batches"""
+        while True:
+            events = await self._drain_batch(self._mapped_queue)
+            try:
+                await self.resolver_layer.resolve_batch(events)
+            except Exception as e:
+                self.logger.error("Error in resolver worker", error=str(e))
+            finally:
+                for _ in events:
+                    self._mapped_queue.task_done()
     
-    async def _handle_resolved_event(self, event: ResolvedEvent):
-        """Handle resolved event from resolver layer"""
-        # No console log - only file log
-        await self.transports_layer.send_to_devices(event)
+    async def _transports_worker(self):
+        """Send resolved events pulled from the resolved queue in batches"""
+        while True:
+            events = await self._drain_batch(self._resolved_queue)
+            try:
+                await self.transports_layer.send_batch(events)
+            except Exception as e:
+                self.logger.error("Error in transports worker", error=str(e))
+            finally:
+                for _ in events:
+                    self._resolved_queue.task_done()
     
-    async def _log_middleware_event(self, event: MiddlewareEventLog):
-        """Log middleware event"""
-        await self.logging_layer.log_middleware_event(event)
+    async def _drain_queues(self):
+        """Wait until every queued event has been resolved and sent"""
+        await self._mapped_queue.join()
+        await self._resolved_queue.join()
     
-    async def _log_device_ingest(self, event: DeviceIngestLog):
-        """Log device ingest event"""
-        await self.logging_layer.log_device_ingest(event)
+    @staticmethod
+    async def _drain_batch(source: asyncio.Queue, max_batch_size: int = 64) -> list:
+        """Wait for one item, then take whatever has queued up behind it"""
+        batch = [await source.get()]
+        while len(batch) < max_batch_size and not source.empty():
+            batch.append(source.get_nowait())
+        return batch
     
     async def start(self):
         """Start the application"""
         self.running = True
         
+        # Run short-lived tasks inline until their first suspension (Python 3.12+)
+        if hasattr(asyncio, 'eager_task_factory'):
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+        
+        # Signals are registered on the loop that is about to wait for them
+        self.setup_signal_handlers()
+        
         try:
-            # Start all layers
+            # Connect the shared client before the layers that use it start
+            if self.mqtt_client:
+                self._mqtt_stack = contextlib.AsyncExitStack()
+                await self._mqtt_stack.enter_async_context(self.mqtt_client)
+            
+            # Start pipeline workers before any input arrives
+            self._worker_tasks = [
+                asyncio.create_task(self._resolver_worker()),
+                asyncio.create_task(self._transports_worker())
+            ]
+            
+            # Start all layers; any failure aborts startup
             await asyncio.gather(
-                self.input_layer.start(),
-                self.transports_layer.start(),
-                self.logging_layer.start(),
-                return_exceptions=True
+                self._start_layer(self.input_layer),
+                self._start_layer(self.transports_layer),
+                self._start_layer(self.logging_layer)
             )
             
             # Keep running until stopped
-            while self.running:
-                await asyncio.sleep(1)
+            await self._stop_event.wait()
                 
         except Exception as e:
             self.logger.error("Error in main loop", error=str(e))
             raise
     
+    async def _start_layer(self, layer):
+        """Start a layer, releasing start() instead of swallowing a failure"""
+        try:
+            await layer.start()
+        except Exception as e:
+            self.logger.error("Failed to start layer", layer=layer.layer_name, error=str(e))
+            self._stop_event.set()
+            raise
+    
     async def stop(self):
         """Stop the application"""
         self.running = False
+        self._stop_event.set()
         
-        # Stop all layers
+        # Stop input first so nothing new enters the pipeline
         if self.input_layer:
             await self.input_layer.stop()
+        
+        # Let the workers deliver what is already queued, upstream queue first
+        if self._worker_tasks:
+            try:
+                await asyncio.wait_for(self._drain_queues(), _DRAIN_TIMEOUT)
+            except asyncio.TimeoutError:
+                self.logger.warning("Shutdown drain timed out, dropping queued events",
+                                    mapped=self._mapped_queue.qsize(),
+                                    resolved=self._resolved_queue.qsize())
+        
+        # Stop pipeline workers
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        
+        # No batches are in flight any more
         if self.transports_layer:
             await self.transports_layer.stop()
         if self.logging_layer:
             await self.logging_layer.stop()
         
+        # Disconnect the shared client once nothing uses it
+        if self._mqtt_stack:
+            try:
+                await self._mqtt_stack.aclose()
+            except Exception:
+                pass
+            self._mqtt_stack = None
+        
         # Stop MQTT broker
-        self._stop_mqtt_broker()
+        await self._stop_mqtt_broker()
+        
+        # Close the structlog output file last, nothing logs after this point
+        if self._log_stream:
+            self._log_stream.close()
+            self._log_stream = None
     
-    def _start_mqtt_broker(self):
+    async def _start_mqtt_broker(self):
         """Start MQTT broker"""
-        import subprocess
-        import os
+        mosquitto_conf = self._mosquitto_conf
+        if not mosquitto_conf:
+            return
         
         try:
-            # Stop any existing mosquitto processes (silently ignore errors)
-            try:
-                subprocess.run(["pkill", "mosquitto"], check=False, capture_output=True)
-            except:
-                pass
+            # Only clean up when something still holds the broker port
+            port = self._broker_port()
+            if not self._port_free(port):
+                # psutil cleanup returns once the old processes have exited;
+                # only the command fallback needs to poll for the port
+                if not await self._release_broker_port():
+                    delay = 0.1
+                    for _ in range(5):
+                        if self._port_free(port):
+                            break
+                        await asyncio.sleep(delay)
+                        delay *= 2
             
-            # Get the directory where mosquitto.conf is located
-            # Try multiple possible locations
-            possible_paths = [
-                Path(self.config_path).parent / "mosquitto.conf",  # config/mosquitto.conf
-                Path("mosquitto.conf"),  # current directory
-                Path("../mosquitto.conf"),  # parent directory
-            ]
-            
-            mosquitto_conf = None
-            for path in possible_paths:
-                if path.exists():
-                    mosquitto_conf = path
-                    break
-            
-            if not mosquitto_conf:
-                print(f"Warning: mosquitto.conf not found. Searched: {[str(p) for p in possible_paths]}")
-                return
+            # Start mosquitto with the config file; verbose per-packet logging only at DEBUG
+            cmd = ["mosquitto", "-c", str(mosquitto_conf), "-d"]
+            if self.config.logging.level.upper() == "DEBUG":
+                cmd.append("-v")
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=str(mosquitto_conf.parent),
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE
+            )
             
-            # Start mosquitto with the config file
-            result = subprocess.run([
-                "mosquitto", 
-                "-c", str(mosquitto_conf), 
-                "-d"
-            ], cwd=str(mosquitto_conf.parent), capture_output=True, text=True)
+            # Keep reading broker output so a full pipe can never stall mosquitto;
+            # the last lines are kept to explain a failed start
+            broker_output = deque(maxlen=20)
+            self._broker_output_task = asyncio.create_task(self._drain_broker_output(proc.stderr, broker_output))
+            returncode = await proc.wait()
             
-            if result.returncode == 0:
+            if returncode == 0:
                 pass  # MQTT broker started successfully
             else:
-                print(f"Failed to start MQTT broker: {result.stderr}")
+                # No daemon holds the pipe after a failed start, so output ends promptly
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(asyncio.shield(self._broker_output_task), 1.0)
+                details = "\n".join(broker_output)
+                print(f"Failed to start MQTT broker (exit code {returncode})" + (f":\n{details}" if details else ""))
                 
         except FileNotFoundError:
             print("Warning: mosquitto not found. Please install mosquitto or start MQTT broker manually.")
         except Exception as e:
             print(f"Error starting MQTT broker: {e}")
     
-    def _stop_mqtt_broker(self):
+    def _resolve_mosquitto_conf(self) -> Optional[Path]:
+        """Locate mosquitto.conf once; restarts reuse the result"""
+        # Try config/mosquitto.conf first, then the fixed fallbacks
+        possible_paths = (Path(self.config_path).parent / "mosquitto.conf",) + _MOSQUITTO_CONF_FALLBACKS
+        
+        for path in possible_paths:
+            if path.exists():
+                return path
+        
+        print(f"Warning: mosquitto.conf not found. Searched: {[str(p) for p in possible_paths]}")
+        return None
+    
+    async def _stop_mqtt_broker(self):
         """Stop MQTT broker"""
-        import subprocess
+        if self._broker_output_task:
+            self._broker_output_task.cancel()
+            self._broker_output_task = None
+        
+        # Signal our own broker directly; scan for port owners only without a pid file
+        if not self._signal_broker_pid():
+            try:
+                await self._release_broker_port()
+            except RuntimeError:
+                # Port belongs to some other program, not ours to stop
+                pass
+    
+    @staticmethod
+    def _signal_broker_pid() -> bool:
+        """Send SIGTERM to the broker recorded in the pid file, returns False if there is none"""
         try:
-            subprocess.run(["pkill", "mosquitto"], check=False, capture_output=True)
-        except Exception as e:
-            pass
+            pid = int(_MOSQUITTO_PID_FILE.read_text().strip())
+        except (OSError, ValueError):
+            return False
+        
+        # A stale pid file may point at an unrelated process by now
+        if PSUTIL_AVAILABLE:
+            try:
+                if 'mosquitto' not in psutil.Process(pid).name():
+                    return False
+            except psutil.Error:
+                return False
+        
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except (ProcessLookupError, PermissionError):
+            return False
+        return True
+    
+    async def _drain_broker_output(self, stream, lines: deque):
+        """Forward mosquitto output lines to the application logger, keeping recent ones in lines"""
+        async for line in stream:
+            text = line.decode(errors='replace').rstrip()
+            lines.append(text)
+            self.logger.info(f"mosquitto: {text}")
+    
+    @staticmethod
+    async def _run_command(cmd, cwd=None) -> int:
+        """Run a command without blocking the event loop, returns its exit code"""
+        # Output is never inspected, so no pipes are allocated for it
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=cwd,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        return await proc.wait()
+    
+    def _broker_port(self) -> int:
+        """Port the local broker listens on"""
+        if self.config and self.config.input.mqtt:
+            return self.config.input.mqtt.port
+        return 1883
+    
+    @staticmethod
+    def _port_free(port: int) -> bool:
+        """Check whether the port can be bound, without connecting to it"""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            # SO_REUSEADDR so lingering TIME_WAIT sockets do not count as busy
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind(('0.0.0.0', port))
+            return True
+        except OSError:
+            return False
+        finally:
+            sock.close()
+    
+    @staticmethod
+    def _owners_of_port(port: int):
+        """Return (pid, name) of processes listening on the given TCP port"""
+        owners = []
+        for conn in psutil.net_connections(kind='inet'):
+            if conn.pid and conn.laddr and conn.laddr.port == port and conn.status == psutil.CONN_LISTEN:
+                try:
+                    owners.append((conn.pid, psutil.Process(conn.pid).name()))
+                except psutil.NoSuchProcess:
+                    pass
+        return owners
+    
+    def _terminate_port_owners(self, port: int):
+        """Terminate mosquitto listeners on the port and wait until they have exited
+
+        Raises RuntimeError, without touching anything, if another program holds the port.
+        """
+        owners = self._owners_of_port(port)
+        foreign = [f"{name} (pid {pid})" for pid, name in owners if 'mosquitto' not in name]
+        if foreign:
+            raise RuntimeError(f"MQTT broker port {port} in use by {', '.join(foreign)}")
+        
+        procs = []
+        for pid, _name in owners:
+            try:
+                proc = psutil.Process(pid)
+                proc.terminate()
+                procs.append(proc)
+            except psutil.NoSuchProcess:
+                pass
+        
+        # wait_procs returns as soon as every process has exited
+        _gone, alive = psutil.wait_procs(procs, timeout=1)
+        for proc in alive:
+            try:
+                proc.kill()
+            except psutil.NoSuchProcess:
+                pass
+        if alive:
+            psutil.wait_procs(alive, timeout=2)
+    
+    async def _release_broker_port(self) -> bool:
+        """Terminate mosquitto processes holding the broker port, falling back to cleanup commands
+
+        Returns True when the owning processes were waited on until exit. Raises
+        RuntimeError if the port is held by a program other than mosquitto.
+        """
+        port = self._broker_port()
+        
+        # Our own broker first; the scan below then only waits for it to exit
+        self._signal_broker_pid()
+        
+        if PSUTIL_AVAILABLE:
+            try:
+                # wait_procs blocks, keep it off the event loop
+                await asyncio.to_thread(self._terminate_port_owners, port)
+                return True
+            except psutil.Error:
+                # Connection table needs elevated rights on some platforms
+                pass
+        
+        for step in _BROKER_CLEANUP_STEPS:
+            try:
+                await self._run_command(list(step))
+            except Exception:
+                # Tool not installed; try the next one
+                continue
+            if self._port_free(port):
+                break
+        return False
     
     def setup_signal_handlers(self):
-        """Setup signal handlers for graceful shutdown"""
-        def signal_handler(signum, frame):
-            asyncio.create_task(self.stop())
+        """Setup signal handlers for graceful shutdown (call from the running loop)"""
+        loop = asyncio.get_running_loop()
         
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        # Signals only release start(); main() runs stop() once on the way out
+        try:
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.add_signal_handler(sig, self._stop_event.set)
+        except NotImplementedError:
+            # Windows event loops have no add_signal_handler
+            def signal_handler(signum, frame):
+                loop.call_soon_threadsafe(self._stop_event.set)
+            
+            signal.signal(signal.SIGINT, signal_handler)
+            signal.signal(signal.SIGTERM, signal_handler)
 
 
 async def main():
@@ -307,7 +628,6 @@ async def main():
     
     try:
         await app.initialize()
-        app.setup_signal_handlers()
         await app.start()
     except KeyboardInterrupt:
         pass
@@ -319,4 +639,13 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Use libuv-backed event loop when available (not supported on Windows);
+    # passed as a loop factory since event loop policies are deprecated
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+    
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
\ No newline at end of file
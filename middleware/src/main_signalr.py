@@ -4,34 +4,34 @@ IoT Data Bridge - SignalR Main Entry Point (Optimized)
 """
 
 import asyncio
+import importlib.util
 import logging
 import os
 import signal
 import sys
-import subprocess
+import traceback
 from pathlib import Path
 
 # Check and install dependencies
 def check_and_install_dependencies():
     """Check and install required dependencies"""
-    required_packages = [
-        'aiofiles',
-        'psutil',
-        'signalrcore',
-        'pydantic',
-        'structlog',
-        'pyyaml'
-    ]
-    
-    missing_packages = []
+    # pip package name -> import name; find_spec checks presence without importing
+    required_packages = {
+        'psutil': 'psutil',
+        'signalrcore': 'signalrcore',
+        'pydantic': 'pydantic',
+        'structlog': 'structlog',
+        'pyyaml': 'yaml',
+    }
     
-    for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
-            missing_packages.append(package)
+    missing_packages = [
+        package for package, module in required_packages.items()
+        if importlib.util.find_spec(module) is None
+    ]
     
     if missing_packages:
+        import subprocess  # Only needed on the rare install path
+        
         print(f"Installing missing dependencies: {', '.join(missing_packages)}")
         try:
             subprocess.check_call([
@@ -47,7 +47,49 @@ def check_and_install_dependencies():
 check_and_install_dependencies()
 
 import structlog
-import yaml
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# Config locations tried when no path is given, in order
+_CONFIG_CANDIDATES = (
+    Path("config/app-signalr.yaml"),
+    Path("middleware/config/app-signalr.yaml"),
+    Path("app-signalr.yaml"),
+)
+
+# Locations searched for the SignalR hub project
+_SIGNALR_HUB_PATHS = (
+    Path("signalr_hub"),  # current directory
+    Path("../signalr_hub"),  # parent directory
+    Path("middleware/signalr_hub"),  # middleware subdirectory
+)
+
+# Environment for dotnet CLI calls, built once: no telemetry upload or banner per invocation
+_DOTNET_ENV = {**os.environ, "DOTNET_CLI_TELEMETRY_OPTOUT": "1", "DOTNET_NOLOGO": "1"}
+
+# Address the hub binds (see signalr_hub/Program.cs) and its health probe
+_HUB_ADDRESS = ("127.0.0.1", 5000)
+_HUB_HEALTH_REQUEST = b"GET /health HTTP/1.0\r\nHost: localhost\r\n\r\n"
+_HUB_STARTUP_TIMEOUT = 10.0  # seconds, upper bound; startup returns once /health answers
+_EXTERNAL_HUB_TIMEOUT = 30.0  # seconds to wait for a hub run by a supervisor or start script
+_HUB_STOP_TIMEOUT = 5.0  # seconds the hub gets to exit after SIGTERM before it is killed
+
+
+def _format_exc_info(logger, method_name, event_dict):
+    """Run structlog's format_exc_info only for records that carry exc_info"""
+    if "exc_info" not in event_dict:
+        return event_dict
+    return structlog.processors.format_exc_info(logger, method_name, event_dict)
 
 from layers.input_signalr import InputLayer
 from layers.mapping import MappingLayer
@@ -57,7 +99,8 @@ from layers.logging import LoggingLayer
 from catalogs.mapping_catalog import MappingCatalog
 from catalogs.device_catalog import DeviceCatalog
 from models.config import AppConfig
-from models.events import IngressEvent, MappedEvent, ResolvedEvent, MiddlewareEventLog, DeviceIngestLog
+from utils.console_echo import echo_warnings
+from utils.yaml_cache import load_yaml_cached
 
 
 class IoTDataBridge:
@@ -67,6 +110,7 @@ class IoTDataBridge:
         self.config_path = config_path
         self.config = None
         self.logger = None
+        self._log_stream = None
         
         # Layer instances
         self.mapping_catalog = None
@@ -79,9 +123,12 @@ class IoTDataBridge:
         
         # Running state
         self.is_running = False
+        self._stop_event = asyncio.Event()
+        self._hub_process = None
     
     async def initialize(self):
         """Initialize the IoT Data Bridge"""
+        hub_ready = None
         try:
             # Load configuration
             await self._load_config()
@@ -89,22 +136,49 @@ class IoTDataBridge:
             # Setup logging
             self._setup_logging()
             
+            # Bring the hub up in the background so its build and JIT warm-up
+            # overlap catalog and layer initialization
+            hub_ready = asyncio.create_task(self._prepare_signalr_hub())
+            
             # Initialize catalogs
             await self._initialize_catalogs()
             
             # Initialize layers
             await self._initialize_layers()
             
-            # Start SignalR hub only if not disabled
-            if not os.environ.get('DISABLE_AUTO_SIGNALR_HUB'):
-                self._start_signalr_hub()
+            # Pooled connections need a running hub
+            await hub_ready
+            
+            # Pre-warm connections for better performance
+            try:
+                await self._pre_warm_connections()
+            except Exception as e:
+                # Silent pre-warm failure
+                pass
             
         except Exception as e:
             print(f"Failed to initialize IoT Data Bridge: {e}")
-            import traceback
             traceback.print_exc()
+            if hub_ready is not None and not hub_ready.done():
+                hub_ready.cancel()
+                # Let the task unwind so a hub it already spawned is recorded
+                try:
+                    await hub_ready
+                except (asyncio.CancelledError, Exception):
+                    pass
+            if self._hub_process is not None:
+                await self._stop_signalr_hub()
             sys.exit(1)
     
+    async def _prepare_signalr_hub(self):
+        """Start the SignalR hub, or wait for an externally supervised one"""
+        # Start SignalR hub only if not disabled
+        if not os.environ.get('DISABLE_AUTO_SIGNALR_HUB'):
+            await self._start_signalr_hub()
+        elif not await self._wait_until(self._hub_healthy, timeout=_EXTERNAL_HUB_TIMEOUT):
+            # Hub is supervised outside this process; only wait for it to be ready
+            print(f"Warning: SignalR hub not ready after {_EXTERNAL_HUB_TIMEOUT:.0f}s, continuing")
+    
     async def _load_config(self):
         """Load configuration from YAML file"""
         if self.config_path:
@@ -112,73 +186,54 @@ class IoTDataBridge:
             if not config_file.exists():
                 raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
         else:
-            # Try multiple possible config file locations
-            config_files = [
-                "config/app-signalr.yaml",
-                "middleware/config/app-signalr.yaml",
-                "app-signalr.yaml"
-            ]
-            
-            config_file = None
-            for file in config_files:
-                if Path(file).exists():
-                    config_file = Path(file)
-                    break
+            # First candidate that is a regular file; one stat per candidate tried
+            config_file = next((path for path in _CONFIG_CANDIDATES if path.is_file()), None)
             
             if not config_file:
-                raise FileNotFoundError(f"No configuration file found. Available options: {config_files}")
+                raise FileNotFoundError(f"No configuration file found. Available options: {[str(p) for p in _CONFIG_CANDIDATES]}")
+        
+        # Parsed config is cached next to the YAML as JSON and reused while the
+        # file's mtime and size match; read and parse in one worker-thread hop
+        config_data = await asyncio.to_thread(load_yaml_cached, config_file)
         
-        with open(config_file, 'r', encoding='utf-8') as f:
-            config_data = yaml.safe_load(f)
         self.config = AppConfig(**config_data)
     
     def _setup_logging(self):
         """Setup structured logging"""
-        # Custom formatter for console logs (same as file format)
-        def console_formatter(logger, method_name, event_dict):
-            """Console formatter matching file log format"""
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            message = event_dict.get('event', '')
-            
-            # Extract key fields
-            device_id = event_dict.get('device_id', '')
-            object_name = event_dict.get('object', '')
-            value = event_dict.get('value', '')
-            
-            # Show Data sent logs in console with proper format (no timestamp - structlog will add it)
-            if message == "Data sent" and device_id and object_name and value != '':
-                return f"Data sent | device_id={device_id} | object={object_name} | value={value}"
-            else:
-                # Show other important logs normally
-                return message
-        
-        structlog.configure(
-            processors=[
-                structlog.stdlib.filter_by_level,
-                structlog.stdlib.add_log_level,
-                structlog.processors.TimeStamper(fmt="%H:%M:%S"),
-                structlog.processors.format_exc_info,
-                structlog.processors.UnicodeDecoder(),
-                console_formatter # Use the custom console formatter
-            ],
-            context_class=dict,
-            logger_factory=structlog.stdlib.LoggerFactory(),
-            wrapper_class=structlog.stdlib.BoundLogger,
-            cache_logger_on_first_use=True,
-        )
-        
         # Setup file logging
         log_file = Path(self.config.logging.file)
         log_file.parent.mkdir(parents=True, exist_ok=True)
+        level = getattr(logging, self.config.logging.level.upper())
+        
+        # Root level mirrors the configured level so layers can cheaply check isEnabledFor
+        logging.getLogger().setLevel(level)
+        
+        # No UnicodeDecoder: payloads are decoded to str at ingress, and the
+        # renderer's fallback handler covers any stray non-JSON value
+        processors = [
+            structlog.processors.add_log_level,
+            structlog.processors.TimeStamper(fmt="%H:%M:%S"),
+            _format_exc_info,
+        ]
+        # Render straight to the log file, bypassing the stdlib logging machinery
+        if ORJSON_AVAILABLE:
+            self._log_stream = open(log_file, 'ab')
+            processors.append(structlog.processors.JSONRenderer(serializer=orjson.dumps))
+            logger_factory = structlog.BytesLoggerFactory(file=self._log_stream)
+        else:
+            self._log_stream = open(log_file, 'a', encoding='utf-8')
+            processors.append(structlog.processors.JSONRenderer())
+            logger_factory = structlog.WriteLoggerFactory(file=self._log_stream)
+        
+        # Warnings and errors are mirrored to stderr, the same as the MQTT entry point
+        processors.append(echo_warnings)
         
-        logging.basicConfig(
-            level=getattr(logging, self.config.logging.level.upper()),
-            format='%(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler()
-            ]
+        structlog.configure(
+            processors=processors,
+            context_class=dict,
+            logger_factory=logger_factory,
+            wrapper_class=structlog.make_filtering_bound_logger(level),
+            cache_logger_on_first_use=True,
         )
         
         self.logger = structlog.get_logger("iot_data_bridge")
@@ -191,7 +246,6 @@ class IoTDataBridge:
             raise FileNotFoundError(f"Mapping catalog not found: {mapping_catalog_path}")
         
         self.mapping_catalog = MappingCatalog(mapping_catalog_path)
-        await self.mapping_catalog.load()
         
         # Initialize device catalog
         device_catalog_path = Path(self.config.device_catalog_path)
@@ -199,47 +253,43 @@ class IoTDataBridge:
             raise FileNotFoundError(f"Device catalog not found: {device_catalog_path}")
         
         self.device_catalog = DeviceCatalog(device_catalog_path)
-        await self.device_catalog.load()
+        
+        # Catalogs are independent, load them concurrently
+        await asyncio.gather(self.mapping_catalog.load(), self.device_catalog.load())
     
     async def _initialize_layers(self):
         """Initialize all layers with performance optimizations"""
         # Initialize logging layer first for better performance monitoring
         self.logging_layer = LoggingLayer(self.config.logging)
         
-        # Initialize input layer with optimized settings
-        self.input_layer = InputLayer(
-            self.config.input,
-            self._handle_ingress_event
-        )
+        # Layers are built downstream-first so each one's entry coroutine can be
+        # handed to the layer before it as its callback, with no wrapper hop
         
-        # Initialize mapping layer with caching
-        self.mapping_layer = MappingLayer(
-            self.mapping_catalog,
-            self._handle_mapped_event
+        # Initialize transports layer with connection pooling
+        self.transports_layer = TransportsLayer(
+            self.config.transports,
+            self.device_catalog,
+            self.logging_layer.log_device_ingest
         )
         
         # Initialize resolver layer with optimized device lookup
         self.resolver_layer = ResolverLayer(
             self.device_catalog,
-            self._handle_resolved_event
+            self.logging_layer.log_middleware_event,
+            transports_callback=self.transports_layer.send_to_devices
         )
         
-        # Initialize transports layer with connection pooling
-        self.transports_layer = TransportsLayer(
-            self.config.transports,
-            self.device_catalog,
-            self._handle_device_ingest
+        # Initialize mapping layer with caching
+        self.mapping_layer = MappingLayer(
+            self.mapping_catalog,
+            self.resolver_layer.resolve_event
         )
         
-        # Set up optimized layer callbacks
-        self.resolver_layer.set_transports_callback(self._handle_resolved_event)
-        
-        # Pre-warm connections for better performance
-        try:
-            await self._pre_warm_connections()
-        except Exception as e:
-            # Silent pre-warm failure
-            pass
+        # Initialize input layer with optimized settings
+        self.input_layer = InputLayer(
+            self.config.input,
+            self.mapping_layer.map_event
+        )
     
     async def _pre_warm_connections(self):
         """Pre-warm connections for better performance"""
@@ -267,56 +317,57 @@ class IoTDataBridge:
             # Silent pre-warm failure
             pass
     
-    def _start_signalr_hub(self):
+    async def _start_signalr_hub(self):
         """Start SignalR hub with better error handling"""
-        import subprocess
-        import os
-        import time
-        
         try:
-            # Stop any existing dotnet processes (silently ignore errors)
-            try:
-                subprocess.run(["pkill", "dotnet"], check=False, capture_output=True)
-            except:
-                pass
-            
             # Get the directory where signalr_hub is located
-            possible_paths = [
-                Path("signalr_hub"),  # current directory
-                Path("../signalr_hub"),  # parent directory
-                Path("middleware/signalr_hub"),  # middleware subdirectory
-            ]
-            
-            signalr_hub_dir = None
-            for path in possible_paths:
-                if path.exists():
-                    signalr_hub_dir = path
-                    break
+            signalr_hub_dir = next((path for path in _SIGNALR_HUB_PATHS if path.is_dir()), None)
             
             if not signalr_hub_dir:
-                print(f"Warning: signalr_hub directory not found. Searched: {[str(p) for p in possible_paths]}")
+                print(f"Warning: signalr_hub directory not found. Searched: {[str(p) for p in _SIGNALR_HUB_PATHS]}")
                 return
             
+            # A hub left behind by an earlier run still holds the port; stop only
+            # processes started from the hub directory, never unrelated dotnet apps
+            if await self._port_in_use(*_HUB_ADDRESS):
+                try:
+                    await asyncio.to_thread(self._terminate_stale_hubs, signalr_hub_dir)
+                except Exception:
+                    pass
+                
+                async def port_released():
+                    return not await self._port_in_use(*_HUB_ADDRESS)
+                
+                await self._wait_until(port_released, interval=0.1, timeout=1.0)
+            
             # Check if dotnet is available
-            try:
-                subprocess.run(["dotnet", "--version"], check=True, capture_output=True)
-            except (subprocess.CalledProcessError, FileNotFoundError):
+            if await self._run_command(["dotnet", "--version"], env=_DOTNET_ENV) != 0:
                 return
             
-            # Start SignalR hub in background
-            result = subprocess.Popen([
-                "dotnet", "run"
-            ], cwd=str(signalr_hub_dir), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            # Start SignalR hub in background; its output is not read, so no pipes
+            # that could fill up and stall it. Its own session (POSIX) lets stop
+            # signal dotnet run and the hub app it spawns as one process group
+            self._hub_process = await asyncio.create_subprocess_exec(
+                "dotnet", "run",
+                cwd=str(signalr_hub_dir),
+                env=_DOTNET_ENV,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+                start_new_session=True
+            )
+            
+            # Poll the hub's health endpoint instead of sleeping a fixed time;
+            # a hub process that already exited ends the wait too
+            async def hub_settled():
+                return self._hub_process.returncode is not None or await self._hub_healthy()
             
-            # Give it more time to start
-            time.sleep(3)
+            await self._wait_until(hub_settled, timeout=_HUB_STARTUP_TIMEOUT)
             
             # Check if process is still running
-            if result.poll() is None:
+            if self._hub_process.returncode is None:
                 # Silent success
                 pass
             else:
-                stdout, stderr = result.communicate()
                 # Silent failure
                 pass
                 
@@ -327,38 +378,128 @@ class IoTDataBridge:
             # Silent failure
             pass
     
-    def _stop_signalr_hub(self):
-        """Stop SignalR hub"""
-        import subprocess
+    @staticmethod
+    async def _wait_until(predicate, interval: float = 0.2, timeout: float = 10.0) -> bool:
+        """Await predicate() every interval seconds until it is true or timeout passes"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while not await predicate():
+            if loop.time() >= deadline:
+                return False
+            await asyncio.sleep(interval)
+        return True
+    
+    @staticmethod
+    async def _port_in_use(host: str, port: int, timeout: float = 0.5) -> bool:
+        """Check whether something accepts connections on the port, without blocking the loop"""
         try:
-            subprocess.run(["pkill", "dotnet"], check=False, capture_output=True)
-        except Exception as e:
-            pass
+            _reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+        except (OSError, asyncio.TimeoutError):
+            return False
+        writer.close()
+        return True
+    
+    @staticmethod
+    async def _hub_healthy(timeout: float = 1.0) -> bool:
+        """Check the hub's /health endpoint on the event loop"""
+        try:
+            reader, writer = await asyncio.wait_for(asyncio.open_connection(*_HUB_ADDRESS), timeout)
+        except (OSError, asyncio.TimeoutError):
+            return False
+        
+        try:
+            writer.write(_HUB_HEALTH_REQUEST)
+            response = await asyncio.wait_for(reader.read(), timeout)
+        except (OSError, asyncio.TimeoutError):
+            return False
+        finally:
+            writer.close()
+        
+        head, _, body = response.partition(b"\r\n\r\n")
+        return head.split(b" ", 2)[1:2] == [b"200"] and body.strip() == b"OK"
     
-    async def _handle_ingress_event(self, event: IngressEvent):
-        """Handle ingress event from input layer"""
-        # No console log - only file log
-        await self.mapping_layer.map_event(event)
+    @staticmethod
+    def _terminate_stale_hubs(hub_dir: Path):
+        """Terminate hub processes from an earlier run and wait for them to exit
+
+        Matches dotnet run started in hub_dir and the hub app built under it.
+        Without psutil nothing is stopped and the new hub may fail to bind.
+        """
+        if not PSUTIL_AVAILABLE:
+            return
+        
+        hub_dir = str(hub_dir.resolve())
+        procs = []
+        for proc in psutil.process_iter(['name', 'exe', 'cwd']):
+            exe = proc.info['exe'] or ''
+            is_dotnet_run = proc.info['name'] in ('dotnet', 'dotnet.exe') and proc.info['cwd'] == hub_dir
+            if is_dotnet_run or exe.startswith(hub_dir + os.sep):
+                try:
+                    proc.terminate()
+                    procs.append(proc)
+                except psutil.Error:
+                    pass
+        
+        # wait_procs returns as soon as every process has exited
+        _gone, alive = psutil.wait_procs(procs, timeout=1)
+        for proc in alive:
+            try:
+                proc.kill()
+            except psutil.Error:
+                pass
+        if alive:
+            psutil.wait_procs(alive, timeout=2)
     
-    async def _handle_mapped_event(self, event: MappedEvent):
-        """Handle mapped event from mapping layer"""
-        # No console log - only file log
-        await self.resolver_layer.resolve_event(event)
+    @staticmethod
+    async def _run_command(cmd, env=None) -> int:
+        """Run a command without blocking the event loop, returns its exit code"""
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            env=env,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        return await proc.wait()
     
-    async def _handle_resolved_event(self, event: ResolvedEvent):
-        """Handle resolved event from resolver layer"""
-        # No console log - only file log
-        await self.transports_layer.send_to_devices(event)
+    async def _stop_signalr_hub(self):
+        """Stop the SignalR hub process this bridge started"""
+        process, self._hub_process = self._hub_process, None
+        if process.returncode is not None:
+            return
+        
+        try:
+            self._signal_hub(process, kill=False)
+            try:
+                await asyncio.wait_for(process.wait(), _HUB_STOP_TIMEOUT)
+            except asyncio.TimeoutError:
+                self._signal_hub(process, kill=True)
+                await process.wait()
+        except (ProcessLookupError, PermissionError):
+            # Already gone
+            pass
     
-    async def _handle_device_ingest(self, event: DeviceIngestLog):
-        """Handle device ingest log"""
-        await self.logging_layer.log_device_ingest(event)
+    @staticmethod
+    def _signal_hub(process, kill: bool):
+        """Terminate or kill the hub; on POSIX its whole process group"""
+        if os.name == 'posix':
+            os.killpg(process.pid, signal.SIGKILL if kill else signal.SIGTERM)
+        elif kill:
+            process.kill()
+        else:
+            process.terminate()
     
     async def start(self):
         """Start the IoT Data Bridge"""
         try:
             self.is_running = True
             
+            # Run short-lived tasks inline until their first suspension (Python 3.12+)
+            if hasattr(asyncio, 'eager_task_factory'):
+                asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+            
+            # Signals are registered on the loop that is about to wait for them
+            self.setup_signal_handlers()
+            
             # Start all layers
             await self.input_layer.start()
             await self.mapping_layer.start()
@@ -366,9 +507,8 @@ class IoTDataBridge:
             await self.transports_layer.start()
             await self.logging_layer.start()
             
-            # Keep running
-            while self.is_running:
-                await asyncio.sleep(1)
+            # Keep running until a signal or stop() sets the event
+            await self._stop_event.wait()
                 
         except KeyboardInterrupt:
             pass
@@ -377,9 +517,26 @@ class IoTDataBridge:
         finally:
             await self.stop()
     
+    def setup_signal_handlers(self):
+        """Setup signal handlers for graceful shutdown (call from the running loop)"""
+        loop = asyncio.get_running_loop()
+        
+        # Signals only release start(), which runs stop() once
+        try:
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.add_signal_handler(sig, self._stop_event.set)
+        except NotImplementedError:
+            # Windows event loops have no add_signal_handler
+            def signal_handler(signum, frame):
+                loop.call_soon_threadsafe(self._stop_event.set)
+            
+            signal.signal(signal.SIGINT, signal_handler)
+            signal.signal(signal.SIGTERM, signal_handler)
+    
     async def stop(self):
         """Stop the IoT Data Bridge"""
         self.is_running = False
+        self._stop_event.set()
         
         # Stop all layers
         if self.input_layer:
@@ -393,8 +550,9 @@ class IoTDataBridge:
         if self.logging_layer:
             await self.logging_layer.stop()
         
-        # Stop SignalR hub
-        self._stop_signalr_hub()
+        # Stop SignalR hub, unless it is supervised outside this process
+        if self._hub_process is not None:
+            await self._stop_signalr_hub()
 
 
 async def main():
@@ -406,20 +564,22 @@ async def main():
     bridge = IoTDataBridge(config_path)
     await bridge.initialize()
     
-    # Setup signal handlers
-    def signal_handler(signum, frame):
-        asyncio.create_task(bridge.stop())
-    
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-    
     # Start the bridge
     await bridge.start()
 
 
 if __name__ == "__main__":
+    # Use libuv-backed event loop when available (not supported on Windows);
+    # passed as a loop factory since event loop policies are deprecated
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+    
     try:
-        asyncio.run(main())
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(main())
     except KeyboardInterrupt:
         print("\nShutdown complete")
     except Exception as e:
@@ -12,6 +12,7 @@ class LoggingConfig(BaseModel):
     file: str = Field(default="logs/iot_data_bridge.log", description="Log file path")
     max_size: int = Field(default=10 * 1024 * 1024, description="Max log file size in bytes")
     backup_count: int = Field(default=5, description="Number of backup files")
+    json_format: bool = Field(default=False, description="Write JSON log lines instead of plain text")
 
 
 class MQTTConfig(BaseModel):
@@ -32,6 +33,9 @@ class SignalRConfig(BaseModel):
     group: str = Field(..., description="SignalR group name")
     username: Optional[str] = Field(default=None, description="SignalR username")
     password: Optional[str] = Field(default=None, description="SignalR password")
+    keepalive_interval: int = Field(default=15, description="SignalR keepalive interval in seconds")
+    retry_delay: float = Field(default=5.0, description="Delay between automatic reconnect attempts in seconds")
+    max_retry_attempts: int = Field(default=5, description="Max automatic reconnect attempts")
 
 
 class InputConfig(BaseModel):
@@ -46,6 +50,7 @@ class TransportsConfig(BaseModel):
     type: str = Field(..., description="Transport type: mqtt or signalr")
     mqtt: Optional[MQTTConfig] = Field(default=None, description="MQTT configuration")
     signalr: Optional[SignalRConfig] = Field(default=None, description="SignalR configuration")
+    ingest_callback_inline: bool = Field(default=False, description="Call synchronous device ingest callbacks inline instead of in an executor")
 
 
 class AppConfig(BaseModel):
@@ -2,6 +2,7 @@
 Event models for IoT Data Bridge - Layer-specific DTOs
 """
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 from pydantic import BaseModel, Field
@@ -26,10 +27,25 @@ class ValueType(str, Enum):
 # INPUT LAYER DTOs
 # ============================================================================
 
+@dataclass(slots=True)
+class RawPayload:
+    """Decoded ingress payload fields - plain slotted struct, built once per message"""
+    equip_tag: Optional[str]           # Equip.Tag
+    message_id: Optional[str]          # Message.ID
+    value: Any                         # VALUE
+    
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any]) -> "RawPayload":
+        """Extract the mapping fields from a raw input message"""
+        payload = raw.get('payload') or {}
+        return cls(payload.get('Equip.Tag'), payload.get('Message.ID'), payload.get('VALUE'))
+
+
 class IngressEvent(BaseModel):
     """Input Layer Output DTO - Raw input event with metadata"""
     trace_id: str = Field(..., description="Unique trace identifier")
     raw: Dict[str, Any] = Field(..., description="Raw input data")
+    payload: Optional[RawPayload] = Field(default=None, description="Fields extracted from raw at decode time")
     meta: Dict[str, Any] = Field(default_factory=dict, description="Metadata")
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Event timestamp")
     
@@ -97,12 +113,15 @@ class TransportConfig(BaseModel):
     config: Dict[str, Any] = Field(..., description="Transport-specific configuration")
 
 
-class DeviceTarget(BaseModel):
-    """Device target DTO for transport"""
-    device_id: str = Field(..., description="Device ID")
-    transport_config: TransportConfig = Field(..., description="Transport configuration")
-    object: str = Field(..., description="Object name")
-    value: Any = Field(..., description="Value to send")
+@dataclass(slots=True)
+class DeviceTarget:
+    """Device target DTO for transport - plain slotted struct, built per device per event"""
+    device_id: str                     # Device ID
+    transport_config: TransportConfig  # Transport configuration
+    object: str                        # Object name
+    value: Any                         # Value to send
+    group: Optional[str] = None        # SignalR group (resolved up front)
+    target: Optional[str] = None       # SignalR client method (resolved up front)
 
 
 class TransportEvent(BaseModel):
@@ -135,18 +154,14 @@ class MiddlewareEventLog(BaseModel):
         }
 
 
-class DeviceIngestLog(BaseModel):
-    """Device ingest log entry"""
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
-    trace_id: str = Field(..., description="Trace ID")
-    device_id: str = Field(..., description="Device ID")
-    object: str = Field(..., description="Object name")
-    value: Any = Field(..., description="Value")
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+@dataclass(slots=True)
+class DeviceIngestLog:
+    """Device ingest log entry - plain slotted struct, built per delivered message"""
+    trace_id: str                      # Trace ID
+    device_id: str                     # Device ID
+    object: str                        # Object name
+    value: Any                         # Value
+    timestamp: datetime = field(default_factory=datetime.utcnow)
 
 
 # ============================================================================
@@ -158,6 +173,8 @@ class LayerResult(BaseModel):
     success: bool = Field(..., description="Operation success status")
     data: Optional[Any] = Field(default=None, description="Result data")
     error: Optional[str] = Field(default=None, description="Error message")
+    processed_count: int = Field(default=0, description="Number of items processed")
+    error_count: int = Field(default=0, description="Number of items that failed")
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Result timestamp")
     
     class Config:
@@ -59,13 +59,16 @@ class PerformanceMonitor:
     
     def record_message(self, layer: str = "unknown"):
         """Record a processed message"""
+        now = time.time()
         self.message_count += 1
         self.message_history.append({
-            'timestamp': time.time(),
+            'timestamp': now,
             'layer': layer
         })
-        self.layer_stats[layer]['processed'] += 1
-        self.layer_stats[layer]['last_activity'] = time.time()
+        # One defaultdict lookup per call; the stats dict is updated in place
+        stats = self.layer_stats[layer]
+        stats['processed'] += 1
+        stats['last_activity'] = now
     
     def record_batch(self, batch_size: int, layer: str = "unknown"):
         """Record a processed batch"""
@@ -91,12 +94,13 @@ class PerformanceMonitor:
     
     def record_processing_time(self, layer: str, processing_time: float):
         """Record processing time for a layer"""
-        current_avg = self.layer_stats[layer]['avg_processing_time']
-        processed = self.layer_stats[layer]['processed']
+        stats = self.layer_stats[layer]
+        current_avg = stats['avg_processing_time']
+        processed = stats['processed']
         
         # Calculate new average
         new_avg = ((current_avg * (processed - 1)) + processing_time) / processed
-        self.layer_stats[layer]['avg_processing_time'] = new_avg
+        stats['avg_processing_time'] = new_avg
     
     async def _monitor_performance(self):
         """Monitor performance metrics"""
@@ -112,7 +116,8 @@ class PerformanceMonitor:
     async def _log_performance_metrics(self):
         """Log performance metrics"""
         try:
-            uptime = time.time() - self.start_time
+            now = time.time()
+            uptime = now - self.start_time
             
             # Calculate rates
             message_rate = self.message_count / uptime if uptime > 0 else 0
@@ -126,10 +131,10 @@ class PerformanceMonitor:
             memory_used_mb = memory.used / 1024 / 1024
             
             # Recent activity (last 5 minutes)
-            recent_cutoff = time.time() - 300
-            recent_messages = sum(1 for msg in self.message_history if msg['timestamp'] > recent_cutoff)
-            recent_batches = sum(1 for batch in self.batch_history if batch['timestamp'] > recent_cutoff)
-            recent_errors = sum(1 for err in self.error_history if err['timestamp'] > recent_cutoff)
+            recent_cutoff = now - 300
+            recent_messages = self._count_since(self.message_history, recent_cutoff)
+            recent_batches = self._count_since(self.batch_history, recent_cutoff)
+            recent_errors = self._count_since(self.error_history, recent_cutoff)
             
             metrics = {
                 'uptime_seconds': uptime,
@@ -154,6 +159,17 @@ class PerformanceMonitor:
         except Exception as e:
             self.logger.error("Error logging performance metrics", error=str(e))
     
+    @staticmethod
+    def _count_since(history: deque, cutoff: float) -> int:
+        """Count history entries newer than cutoff, scanning back from the newest"""
+        count = 0
+        # Entries are appended in time order, so stop at the first old one
+        for entry in reversed(history):
+            if entry['timestamp'] <= cutoff:
+                break
+            count += 1
+        return count
+    
     def get_current_metrics(self) -> Dict[str, Any]:
         """Get current performance metrics"""
         uptime = time.time() - self.start_time
@@ -0,0 +1,113 @@
+"""
+Async Batcher - Generic size/time triggered batching for async producers
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Generic, List, Optional, Set, TypeVar
+import structlog
+
+
+T = TypeVar("T")
+
+
+class AsyncBatcher(ABC, Generic[T]):
+    """Collects queued items and hands them to process_batch in batches
+
+    A batch is flushed when it reaches max_batch_size items or when the
+    first queued item has waited max_queue_time seconds, whichever comes first.
+    """
+
+    def __init__(self, max_batch_size: int = 64, max_queue_time: float = 0.05, max_retries: int = 0, name: str = "async_batcher"):
+        self.max_batch_size = max_batch_size
+        self.max_queue_time = max_queue_time
+        self.max_retries = max_retries
+        self.logger = structlog.get_logger(name)
+
+        self._items: List[T] = []
+        self._timer_task: Optional[asyncio.Task] = None
+        self._batch_tasks: Set[asyncio.Task] = set()
+        self.is_closed = False
+
+        # Success/error tracking (counted per item)
+        self.success_count = 0
+        self.error_count = 0
+
+    @abstractmethod
+    async def process_batch(self, items: List[T]) -> None:
+        """Process a batch of items; raise to signal failure"""
+        pass
+
+    def add(self, item: T) -> bool:
+        """Queue an item for batching, returns False if the batcher is closed"""
+        if self.is_closed:
+            return False
+
+        self._items.append(item)
+
+        if len(self._items) >= self.max_batch_size:
+            self._dispatch()
+        elif self._timer_task is None:
+            self._timer_task = asyncio.create_task(self._flush_after_timeout())
+
+        return True
+
+    async def flush(self) -> None:
+        """Dispatch queued items now and wait for all in-flight batches"""
+        self._dispatch()
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+
+    def abort(self) -> int:
+        """Drop queued items without processing them, returns dropped count"""
+        self._cancel_timer()
+        dropped = len(self._items)
+        self._items = []
+        return dropped
+
+    async def close(self) -> None:
+        """Flush remaining items and stop accepting new ones"""
+        self.is_closed = True
+        await self.flush()
+
+    async def _flush_after_timeout(self):
+        """Flush the pending batch once max_queue_time has elapsed"""
+        try:
+            await asyncio.sleep(self.max_queue_time)
+        except asyncio.CancelledError:
+            return
+        self._timer_task = None
+        self._dispatch()
+
+    def _cancel_timer(self):
+        """Cancel the pending timeout flush"""
+        if self._timer_task is not None:
+            if self._timer_task is not asyncio.current_task():
+                self._timer_task.cancel()
+            self._timer_task = None
+
+    def _dispatch(self):
+        """Hand the current batch to a background processing task"""
+        self._cancel_timer()
+        if not self._items:
+            return
+
+        batch, self._items = self._items, []
+        task = asyncio.create_task(self._run_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, batch: List[T]):
+        """Run process_batch with retries and record the outcome"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                await self.process_batch(batch)
+                self.success_count += len(batch)
+                return
+            except Exception as e:
+                self.logger.error("Error processing batch",
+                                batch_size=len(batch),
+                                attempt=attempt + 1,
+                                error=str(e))
+
+        self.error_count += len(batch)
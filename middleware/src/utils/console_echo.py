@@ -0,0 +1,15 @@
+"""
+Console Echo - Mirrors warning and error log lines to stderr
+"""
+
+import sys
+
+# Log methods that are echoed to the console in addition to the log file
+CONSOLE_METHODS = frozenset(("warning", "error", "critical", "exception"))
+
+
+def echo_warnings(logger, method_name, line):
+    """structlog processor run after the renderer; everything else goes to the file only"""
+    if method_name in CONSOLE_METHODS:
+        print(line.decode() if isinstance(line, bytes) else line, file=sys.stderr)
+    return line
@@ -0,0 +1,78 @@
+"""
+YAML Cache - Reuses a JSON copy of parsed YAML files while they are unchanged
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def load_yaml_cached(path: Path) -> Any:
+    """Parse a YAML file, reusing a JSON sidecar while the file's mtime and size match
+
+    The sidecar is written next to the YAML as .<name>.cache.json (git-ignored).
+    A missing, stale or corrupt sidecar just means a full YAML parse.
+    """
+    stat = path.stat()
+    key = [stat.st_mtime_ns, stat.st_size]
+    cache_file = path.with_name(f".{path.name}.cache.json")
+
+    cached = _read_cache(cache_file, key)
+    if cached is not None:
+        return cached
+
+    # Imported here so a process whose sidecars are all fresh never loads yaml
+    import yaml
+
+    # Prefer the libyaml C loader, fall back to the pure-Python one
+    SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+    # Whole-file bytes keep reading and decoding inside libyaml
+    data = yaml.load(path.read_bytes(), Loader=SafeLoader)
+    _write_cache(cache_file, key, data)
+    return data
+
+
+def _loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
+def _dumps(obj: Any) -> bytes:
+    return orjson.dumps(obj) if ORJSON_AVAILABLE else json.dumps(obj).encode('utf-8')
+
+
+def _read_cache(cache_file: Path, key: list) -> Optional[Any]:
+    """Return cached data if the sidecar matches the key"""
+    try:
+        cached = _loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        return None
+    return cached.get("data")
+
+
+def _write_cache(cache_file: Path, key: list, data: Any):
+    """Write the sidecar atomically, ignoring failures"""
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        payload = _dumps({"key": key, "data": data})
+        # Only cache documents JSON reproduces exactly (no int keys, dates, ...)
+        if _loads(payload)["data"] != data:
+            return
+        tmp_file.write_bytes(payload)
+        os.replace(tmp_file, cache_file)
+    except (OSError, TypeError, ValueError):
+        # Cache is an optimization only; a read-only config dir is fine
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
@@ -118,9 +118,8 @@ dotnet run &
 SIGNALR_PID=$!
 cd ..
 
-# Wait for SignalR Hub to start
-echo "Waiting for SignalR Hub to start..."
-sleep 5
+# Only catch an immediate failure here; the middleware waits for /health itself
+sleep 1
 
 # Check if SignalR Hub is running
 if ! kill -0 $SIGNALR_PID 2>/dev/null; then